@@ -110,7 +110,7 @@ class ApiTicketDetailSerializer:
         }
 
         if include_replies:
-            data["replies"] = [ApiReplySerializer.serialize(reply) for reply in ticket.replies.filter(is_deleted=False)]
+            data["replies"] = [ApiReplySerializer.serialize(reply) for reply in ticket.replies.visible()]
 
         if include_activities:
             data["activities"] = [
@@ -214,7 +214,7 @@ class ApiActivitySerializer:
             "created_at_human": _human_dt(activity.created_at),
         }
         try:
-            causer = activity.causer
+            causer = activity.get_causer()
             data["causer"] = (
                 {"id": causer.pk, "name": getattr(causer, "get_full_name", lambda: str(causer))()} if causer else None
             )
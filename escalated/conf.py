@@ -1,6 +1,8 @@
 import os
+from functools import cache
 
 from django.conf import settings
+from django.core.signals import setting_changed
 
 DEFAULTS = {
     "MODE": "self_hosted",
@@ -65,6 +67,11 @@ DEFAULTS = {
     # Plugin system settings
     "PLUGINS_ENABLED": True,
     "PLUGINS_PATH": None,  # Defaults to <BASE_DIR>/plugins/escalated at runtime
+    # Paths EnsureAgentMiddleware / EnsureAdminMiddleware never guard (static
+    # files, health checks), so those requests skip the auth lookup. Entries
+    # ending in "/" match as prefixes; any other entry must match the path
+    # exactly, so "/healthz" does not also exempt "/healthzanything".
+    "PUBLIC_PATH_PREFIXES": ("/static/", "/media/", "/healthz", "/favicon.ico"),
     # Outbound webhooks reject loopback/private destinations by default.
     "ALLOW_PRIVATE_WEBHOOK_URLS": False,
     # SDK plugin bridge (Node.js runtime) — opt-in
@@ -108,7 +115,30 @@ def get_setting(name):
     return value
 
 
+@cache
+def _table_prefix():
+    # Every model and migration module asks for this at import time; read the
+    # setting once per process. Cleared below when ESCALATED is overridden.
+    return get_setting("TABLE_PREFIX")
+
+
+def _clear_table_prefix(*, setting, **kwargs):
+    if setting == "ESCALATED":
+        _table_prefix.cache_clear()
+
+
+setting_changed.connect(_clear_table_prefix)
+
+
 def get_table_name(suffix):
     """Return a fully-prefixed table name."""
-    prefix = get_setting("TABLE_PREFIX")
-    return f"{prefix}{suffix}"
+    return f"{_table_prefix()}{suffix}"
+
+
+def get_table_names(*suffixes):
+    """
+    Return ``{suffix: prefixed_table_name}`` for several tables at once.
+    Used by migrations that declare many tables.
+    """
+    prefix = _table_prefix()
+    return {suffix: f"{prefix}{suffix}" for suffix in suffixes}
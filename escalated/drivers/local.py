@@ -2,7 +2,6 @@ import logging
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.utils import timezone
 
 from escalated.models import (
     Reply,
@@ -40,10 +39,8 @@ class LocalDriver:
     def create_ticket(self, user, data):
         """Create a new ticket in the local database."""
         with transaction.atomic():
-            ct = ContentType.objects.get_for_model(user)
             ticket = Ticket(
-                requester_content_type=ct,
-                requester_object_id=user.pk,
+                requester=user,
                 subject=data["subject"],
                 description=data["description"],
                 priority=data.get("priority", Ticket.Priority.MEDIUM),
@@ -82,7 +79,7 @@ class LocalDriver:
                 setattr(ticket, field, data[field])
 
         if changes:
-            ticket.save()
+            ticket.save(update_fields=[*changes, "updated_at"])
             ticket_updated.send(sender=Ticket, ticket=ticket, user=user, changes=changes)
 
         return ticket
@@ -94,19 +91,7 @@ class LocalDriver:
         if old_status == new_status:
             return ticket
 
-        ticket.status = new_status
-
-        # Set lifecycle timestamps
-        now = timezone.now()
-        if new_status == Ticket.Status.RESOLVED:
-            ticket.resolved_at = now
-        elif new_status == Ticket.Status.CLOSED:
-            ticket.closed_at = now
-        elif new_status == Ticket.Status.REOPENED:
-            ticket.resolved_at = None
-            ticket.closed_at = None
-
-        ticket.save()
+        ticket.set_status(new_status)
 
         self._log_activity(
             ticket,
@@ -142,7 +127,7 @@ class LocalDriver:
         if ticket.status == Ticket.Status.OPEN:
             ticket.status = Ticket.Status.IN_PROGRESS
 
-        ticket.save()
+        ticket.save(update_fields=["assigned_to", "status", "updated_at"])
 
         self._log_activity(
             ticket,
@@ -162,7 +147,7 @@ class LocalDriver:
         """Remove agent assignment from a ticket."""
         previous_agent = ticket.assigned_to
         ticket.assigned_to = None
-        ticket.save()
+        ticket.save(update_fields=["assigned_to", "updated_at"])
 
         self._log_activity(
             ticket,
@@ -238,14 +223,9 @@ class LocalDriver:
         qs = Ticket.objects.select_related("assigned_to", "department", "sla_policy").prefetch_related("tags")
 
         if filters:
-            if "status" in filters:
-                qs = qs.filter(status=filters["status"])
-            if "priority" in filters:
-                qs = qs.filter(priority=filters["priority"])
-            if "assigned_to" in filters:
-                qs = qs.filter(assigned_to_id=filters["assigned_to"])
-            if "department" in filters:
-                qs = qs.filter(department_id=filters["department"])
+            qs = qs.filter_by(
+                **{key: filters[key] for key in ("status", "priority", "assigned_to", "department") if key in filters}
+            )
             if "search" in filters:
                 qs = qs.search(filters["search"])
             if "requester_id" in filters and "requester_type" in filters:
@@ -260,35 +240,45 @@ class LocalDriver:
 
     def add_tags(self, ticket, user, tag_ids):
         """Add tags to a ticket."""
-        tags = Tag.objects.filter(pk__in=tag_ids)
+        tags = list(Tag.objects.filter(pk__in=tag_ids))
+        ticket.tags.add(*tags)
+        TicketActivity.bulk_log(
+            [
+                self._build_activity(
+                    ticket,
+                    TicketActivity.ActivityType.TAG_ADDED,
+                    user,
+                    {"tag_id": tag.pk, "tag_name": tag.name},
+                )
+                for tag in tags
+            ]
+        )
         for tag in tags:
-            ticket.tags.add(tag)
-            self._log_activity(
-                ticket,
-                TicketActivity.ActivityType.TAG_ADDED,
-                user,
-                {"tag_id": tag.pk, "tag_name": tag.name},
-            )
             tag_added.send(sender=Tag, tag=tag, ticket=ticket, user=user)
 
     def remove_tags(self, ticket, user, tag_ids):
         """Remove tags from a ticket."""
-        tags = Tag.objects.filter(pk__in=tag_ids)
+        tags = list(Tag.objects.filter(pk__in=tag_ids))
+        ticket.tags.remove(*tags)
+        TicketActivity.bulk_log(
+            [
+                self._build_activity(
+                    ticket,
+                    TicketActivity.ActivityType.TAG_REMOVED,
+                    user,
+                    {"tag_id": tag.pk, "tag_name": tag.name},
+                )
+                for tag in tags
+            ]
+        )
         for tag in tags:
-            ticket.tags.remove(tag)
-            self._log_activity(
-                ticket,
-                TicketActivity.ActivityType.TAG_REMOVED,
-                user,
-                {"tag_id": tag.pk, "tag_name": tag.name},
-            )
             tag_removed.send(sender=Tag, tag=tag, ticket=ticket, user=user)
 
     def change_department(self, ticket, user, department):
         """Change the department of a ticket."""
         old_department = ticket.department
         ticket.department = department
-        ticket.save()
+        ticket.save(update_fields=["department", "updated_at"])
 
         self._log_activity(
             ticket,
@@ -320,7 +310,7 @@ class LocalDriver:
             return ticket
 
         ticket.priority = new_priority
-        ticket.save()
+        ticket.save(update_fields=["priority", "updated_at"])
 
         self._log_activity(
             ticket,
@@ -341,16 +331,20 @@ class LocalDriver:
 
     # ----- internal helpers -----
 
-    def _log_activity(self, ticket, activity_type, user=None, properties=None):
-        """Create an activity log entry."""
+    def _build_activity(self, ticket, activity_type, user=None, properties=None):
+        """Build an unsaved activity log entry."""
         activity_kwargs = {
             "ticket": ticket,
             "type": activity_type,
             "properties": properties or {},
         }
         if user:
-            ct = ContentType.objects.get_for_model(user)
-            activity_kwargs["causer_content_type"] = ct
-            activity_kwargs["causer_object_id"] = user.pk
+            # Through the generic relation, so the user is cached and save()
+            # can mirror it into causer_user without re-checking it exists.
+            activity_kwargs["causer"] = user
 
-        TicketActivity.objects.create(**activity_kwargs)
+        return TicketActivity(**activity_kwargs)
+
+    def _log_activity(self, ticket, activity_type, user=None, properties=None):
+        """Create an activity log entry."""
+        self._build_activity(ticket, activity_type, user, properties).save()
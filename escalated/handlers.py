@@ -1,5 +1,7 @@
 import logging
 
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -382,3 +384,27 @@ def on_custom_action_triggered(sender, ticket, user, action_key, payload=None, m
             "metadata": metadata or {},
         },
     )
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def on_user_deleted(sender, instance, **kwargs):
+    """Revoke the API tokens of a deleted user.
+
+    ApiToken points at its owner through a generic relation, which the
+    database cannot cascade, so without this the rows would be orphaned.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from escalated.models import ApiToken
+
+    ApiToken.objects.filter(
+        tokenable_content_type=ContentType.objects.get_for_model(sender),
+        tokenable_object_id=str(instance.pk),
+    ).delete()
+
+
+@receiver(post_save, sender="escalated.EscalatedSetting")
+@receiver(post_delete, sender="escalated.EscalatedSetting")
+def on_setting_changed(sender, instance, **kwargs):
+    """Evict the cached value read by EscalatedSetting.get()."""
+    sender.forget(instance.key)
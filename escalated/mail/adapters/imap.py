@@ -21,8 +21,18 @@ class IMAPAdapter(BaseAdapter):
     messages, and returns them as InboundMessage instances.
 
     Used by the `poll_imap` management command.
+
+    When constructed with ``persistent=True`` the authenticated connection
+    is kept open between ``fetch_messages()`` calls and checked with a
+    cheap NOOP before reuse, so a long-running poller only pays the
+    TCP/TLS/LOGIN cost when the server has dropped the session. Call
+    ``disconnect()`` when done.
     """
 
+    def __init__(self, persistent: bool = False):
+        self.persistent = persistent
+        self._conn: imaplib.IMAP4_SSL | imaplib.IMAP4 | None = None
+
     @property
     def name(self) -> str:
         return "imap"
@@ -71,6 +81,43 @@ class IMAPAdapter(BaseAdapter):
         except (imaplib.IMAP4.error, OSError) as exc:
             raise ConnectionError(f"Failed to connect to IMAP server {host}:{port}: {exc}") from exc
 
+    def noop(self) -> bool:
+        """
+        Check that the held connection is still alive.
+
+        Returns:
+            True if a persistent connection exists and answered NOOP,
+            False otherwise (the dead connection is discarded).
+        """
+        if self._conn is None:
+            return False
+        try:
+            status, _ = self._conn.noop()
+        except (imaplib.IMAP4.error, OSError):
+            status = None
+        if status != "OK":
+            self.disconnect()
+            return False
+        return True
+
+    def disconnect(self) -> None:
+        """Log out of and forget the held connection, if any."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.logout()
+        except Exception:
+            pass
+
+    def _get_connection(self) -> imaplib.IMAP4_SSL | imaplib.IMAP4:
+        """Return the held connection if still alive, otherwise open a new one."""
+        if not self.persistent:
+            return self.connect()
+        if not self.noop():
+            self._conn = self.connect()
+        return self._conn
+
     def fetch_messages(self) -> list[InboundMessage]:
         """
         Connect to the IMAP server, fetch all unread messages, parse them
@@ -78,8 +125,13 @@ class IMAPAdapter(BaseAdapter):
 
         Returns:
             List of InboundMessage instances.
+
+        Raises:
+            ConnectionError: If connecting fails or the server drops the
+                connection before any message was fetched. A drop after
+                that returns the messages fetched so far.
         """
-        conn = self.connect()
+        conn = self._get_connection()
         mailbox = get_setting("IMAP_MAILBOX") or "INBOX"
         messages = []
 
@@ -115,16 +167,39 @@ class IMAPAdapter(BaseAdapter):
                     # Mark as read (add \Seen flag)
                     conn.store(num, "+FLAGS", "\\Seen")
 
+                except (imaplib.IMAP4.abort, OSError) as exc:
+                    if not messages:
+                        raise
+                    # Earlier messages are already flagged \Seen on the
+                    # server and won't match UNSEEN again; hand them back
+                    # rather than losing them with the connection.
+                    logger.warning(
+                        f"IMAP connection lost after {len(messages)} message(s); returning those fetched: {exc}"
+                    )
+                    self._conn = None
+                    break
                 except Exception as exc:
                     logger.error(f"Error processing IMAP message {num}: {exc}")
                     continue
 
+        except (imaplib.IMAP4.abort, OSError) as exc:
+            self._conn = None
+            raise ConnectionError(f"IMAP connection lost: {exc}") from exc
+
         finally:
-            try:
-                conn.close()
-                conn.logout()
-            except Exception:
-                pass
+            if conn is self._conn:
+                # Leave the session authenticated for the next poll; only
+                # deselect the mailbox so flags are flushed.
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            else:
+                try:
+                    conn.close()
+                    conn.logout()
+                except Exception:
+                    pass
 
         return messages
 
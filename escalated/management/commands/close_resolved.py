@@ -1,11 +1,8 @@
-from datetime import timedelta
-
 from django.core.management.base import BaseCommand
-from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from escalated.conf import get_setting
-from escalated.models import Ticket
+from escalated.services.maintenance_service import MaintenanceService
 
 
 class Command(BaseCommand):
@@ -23,18 +20,20 @@ class Command(BaseCommand):
             action="store_true",
             help=_("Show what would be closed without making changes"),
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help=_("Number of tickets to close per UPDATE statement (default: 5000)"),
+        )
 
     def handle(self, *args, **options):
         days = options["days"] or get_setting("AUTO_CLOSE_RESOLVED_AFTER_DAYS")
         dry_run = options["dry_run"]
 
-        threshold = timezone.now() - timedelta(days=days)
-
-        stale_tickets = Ticket.objects.filter(
-            status=Ticket.Status.RESOLVED,
-            resolved_at__isnull=False,
-            resolved_at__lt=threshold,
-        )
+        # The preview only prints reference/subject; don't hydrate the
+        # description/metadata columns for it.
+        stale_tickets = MaintenanceService.stale_resolved_tickets(days).only("reference", "subject")
 
         count = stale_tickets.count()
 
@@ -51,11 +50,7 @@ class Command(BaseCommand):
             self.stdout.write(_("No resolved tickets to auto-close."))
             return
 
-        now = timezone.now()
-        updated = stale_tickets.update(
-            status=Ticket.Status.CLOSED,
-            closed_at=now,
-        )
+        updated = MaintenanceService.close_resolved_tickets(days, batch_size=options["batch_size"])
 
         self.stdout.write(
             self.style.SUCCESS(
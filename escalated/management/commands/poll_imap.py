@@ -24,6 +24,12 @@ class Command(BaseCommand):
             default=60,
             help="Polling interval in seconds when running continuously (default: 60).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of messages to process concurrently (default: 1, sequential).",
+        )
 
     def handle(self, *args, **options):
         if not get_setting("INBOUND_EMAIL_ENABLED"):
@@ -39,58 +45,48 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR("IMAP host not configured. Set ESCALATED['IMAP_HOST'] in settings."))
             return
 
+        from escalated.mail.adapters.imap import IMAPAdapter
+
         continuous = options["continuous"]
         interval = options["interval"]
+        workers = max(1, options["workers"])
 
         if continuous:
             self.stdout.write(f"Starting continuous IMAP polling (interval: {interval}s)...")
-            while True:
-                try:
-                    self._poll_once()
-                except KeyboardInterrupt:
-                    self.stdout.write("\nStopping IMAP polling.")
-                    break
-                except Exception as exc:
-                    self.stderr.write(self.style.ERROR(f"Error during IMAP poll: {exc}"))
-                    logger.exception("Error during IMAP poll")
-
-                time.sleep(interval)
+            # Hold one authenticated session across cycles; the adapter
+            # reconnects on its own if the server drops it.
+            adapter = IMAPAdapter(persistent=True)
+            try:
+                while True:
+                    try:
+                        self._poll_once(adapter, workers)
+                    except KeyboardInterrupt:
+                        self.stdout.write("\nStopping IMAP polling.")
+                        break
+                    except Exception as exc:
+                        self.stderr.write(self.style.ERROR(f"Error during IMAP poll: {exc}"))
+                        logger.exception("Error during IMAP poll")
+
+                    time.sleep(interval)
+            finally:
+                adapter.disconnect()
         else:
-            self._poll_once()
+            self._poll_once(IMAPAdapter(), workers)
 
-    def _poll_once(self):
+    def _poll_once(self, adapter, workers=1):
         """Execute a single IMAP poll cycle."""
-        from escalated.mail.adapters.imap import IMAPAdapter
         from escalated.services.inbound_email_service import InboundEmailService
 
-        adapter = IMAPAdapter()
-
-        self.stdout.write("Connecting to IMAP server...")
+        self.stdout.write("Polling IMAP server...")
 
         try:
-            messages = adapter.fetch_messages()
+            processed, failed = InboundEmailService.poll_imap(adapter, workers=workers)
         except ConnectionError as exc:
             self.stderr.write(self.style.ERROR(f"IMAP connection failed: {exc}"))
             return
 
-        if not messages:
+        if not processed and not failed:
             self.stdout.write("No new messages found.")
             return
 
-        self.stdout.write(f"Found {len(messages)} new message(s). Processing...")
-
-        processed = 0
-        failed = 0
-
-        for message in messages:
-            inbound = InboundEmailService.process(message, adapter_name="imap")
-            if inbound.status == "processed":
-                processed += 1
-                self.stdout.write(self.style.SUCCESS(f"  Processed: {message.from_email} - {message.subject}"))
-            else:
-                failed += 1
-                self.stdout.write(
-                    self.style.ERROR(f"  Failed: {message.from_email} - {message.subject} ({inbound.error_message})")
-                )
-
         self.stdout.write(self.style.SUCCESS(f"IMAP poll complete: {processed} processed, {failed} failed."))
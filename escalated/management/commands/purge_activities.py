@@ -1,9 +1,6 @@
-from datetime import timedelta
-
 from django.core.management.base import BaseCommand
-from django.utils import timezone
 
-from escalated.models import TicketActivity
+from escalated.services.maintenance_service import MaintenanceService
 
 
 class Command(BaseCommand):
@@ -21,14 +18,18 @@ class Command(BaseCommand):
             action="store_true",
             help="Show what would be purged without making changes",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of activities to delete per statement (default: 5000)",
+        )
 
     def handle(self, *args, **options):
         days = options["days"]
         dry_run = options["dry_run"]
 
-        threshold = timezone.now() - timedelta(days=days)
-        old_activities = TicketActivity.objects.filter(created_at__lt=threshold)
-        count = old_activities.count()
+        count = MaintenanceService.old_activities(days).count()
 
         if dry_run:
             self.stdout.write(f"[DRY RUN] Would purge {count} activities older than {days} days.")
@@ -38,6 +39,6 @@ class Command(BaseCommand):
             self.stdout.write("No old activities to purge.")
             return
 
-        deleted, _ = old_activities.delete()
+        deleted = MaintenanceService.purge_activities(days, batch_size=options["batch_size"])
 
         self.stdout.write(self.style.SUCCESS(f"Purged {deleted} activity records older than {days} days."))
@@ -1,9 +1,42 @@
+from functools import lru_cache
+
 from django.http import HttpResponseForbidden, HttpResponseRedirect
 from django.urls import reverse
+from django.utils.translation import get_language, gettext_noop
 from django.utils.translation import gettext as _
 
+from escalated.conf import get_setting
 from escalated.permissions import is_admin, is_agent
 
+_AGENT_DENIED = gettext_noop("You do not have permission to access the agent dashboard.")
+_ADMIN_DENIED = gettext_noop("You do not have permission to access the admin area.")
+
+
+@lru_cache(maxsize=64)
+def _denied_body(message, language):
+    """Translated, pre-encoded 403 body for ``message`` in ``language``."""
+    return _(message).encode("utf-8")
+
+
+def _public_paths():
+    """
+    Split PUBLIC_PATH_PREFIXES into exact paths and directory prefixes.
+
+    Only entries ending in "/" match as prefixes; "/healthz" exempts that
+    path alone, not "/healthzanything".
+    """
+    entries = get_setting("PUBLIC_PATH_PREFIXES") or ()
+    return (
+        frozenset(entry for entry in entries if not entry.endswith("/")),
+        tuple(entry for entry in entries if entry.endswith("/")),
+    )
+
+
+def _forbidden(message):
+    # Responses are mutable (later middleware adds headers/cookies), so a
+    # fresh one is built per request; only the body is shared.
+    return HttpResponseForbidden(_denied_body(message, get_language()))
+
 
 class EnsureAgentMiddleware:
     """
@@ -13,16 +46,20 @@ class EnsureAgentMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.skip_paths, self.skip_prefixes = _public_paths()
 
     def __call__(self, request):
         return self.get_response(request)
 
     def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.path in self.skip_paths or request.path.startswith(self.skip_prefixes):
+            return None
+
         if not request.user.is_authenticated:
             return HttpResponseRedirect(reverse("login"))
 
         if not is_agent(request.user) and not is_admin(request.user):
-            return HttpResponseForbidden(_("You do not have permission to access the agent dashboard."))
+            return _forbidden(_AGENT_DENIED)
 
         return None
 
@@ -35,16 +72,20 @@ class EnsureAdminMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.skip_paths, self.skip_prefixes = _public_paths()
 
     def __call__(self, request):
         return self.get_response(request)
 
     def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.path in self.skip_paths or request.path.startswith(self.skip_prefixes):
+            return None
+
         if not request.user.is_authenticated:
             return HttpResponseRedirect(reverse("login"))
 
         if not is_admin(request.user):
-            return HttpResponseForbidden(_("You do not have permission to access the admin area."))
+            return _forbidden(_ADMIN_DENIED)
 
         return None
 
@@ -2,7 +2,19 @@ import django.db.models.deletion
 from django.conf import settings
 from django.db import migrations, models
 
-from escalated.conf import get_table_name
+from escalated.conf import get_table_names
+
+TABLES = get_table_names(
+    "departments",
+    "sla_policies",
+    "tags",
+    "tickets",
+    "replies",
+    "attachments",
+    "escalation_rules",
+    "canned_responses",
+    "activities",
+)
 
 
 class Migration(migrations.Migration):
@@ -43,7 +55,7 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={
-                "db_table": get_table_name("departments"),
+                "db_table": TABLES["departments"],
                 "ordering": ["name"],
             },
         ),
@@ -85,7 +97,7 @@ class Migration(migrations.Migration):
                 ("updated_at", models.DateTimeField(auto_now=True)),
             ],
             options={
-                "db_table": get_table_name("sla_policies"),
+                "db_table": TABLES["sla_policies"],
                 "verbose_name": "SLA Policy",
                 "verbose_name_plural": "SLA Policies",
             },
@@ -110,7 +122,7 @@ class Migration(migrations.Migration):
                 ("updated_at", models.DateTimeField(auto_now=True)),
             ],
             options={
-                "db_table": get_table_name("tags"),
+                "db_table": TABLES["tags"],
                 "ordering": ["name"],
             },
         ),
@@ -240,7 +252,7 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={
-                "db_table": get_table_name("tickets"),
+                "db_table": TABLES["tickets"],
                 "ordering": ["-created_at"],
             },
         ),
@@ -315,7 +327,7 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={
-                "db_table": get_table_name("replies"),
+                "db_table": TABLES["replies"],
                 "ordering": ["created_at"],
             },
         ),
@@ -358,7 +370,7 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={
-                "db_table": get_table_name("attachments"),
+                "db_table": TABLES["attachments"],
                 "ordering": ["-created_at"],
             },
         ),
@@ -410,7 +422,7 @@ class Migration(migrations.Migration):
                 ("updated_at", models.DateTimeField(auto_now=True)),
             ],
             options={
-                "db_table": get_table_name("escalation_rules"),
+                "db_table": TABLES["escalation_rules"],
                 "ordering": ["order", "name"],
             },
         ),
@@ -445,7 +457,7 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={
-                "db_table": get_table_name("canned_responses"),
+                "db_table": TABLES["canned_responses"],
                 "ordering": ["category", "title"],
             },
         ),
@@ -510,7 +522,7 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={
-                "db_table": get_table_name("activities"),
+                "db_table": TABLES["activities"],
                 "ordering": ["-created_at"],
                 "verbose_name_plural": "Ticket activities",
             },
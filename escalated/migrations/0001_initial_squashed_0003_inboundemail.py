@@ -0,0 +1,505 @@
+"""Squashed 0001_initial..0003_inboundemail.
+
+Fresh installs (and every test database) create the original tables in one
+pass, with Ticket's guest columns part of its CREATE TABLE instead of three
+follow-up ALTER TABLEs. Existing installs that already applied the replaced
+migrations are unaffected.
+"""
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from escalated.conf import get_table_names
+
+TABLES = get_table_names(
+    "departments",
+    "sla_policies",
+    "tags",
+    "tickets",
+    "replies",
+    "attachments",
+    "escalation_rules",
+    "canned_responses",
+    "activities",
+    "settings",
+    "inbound_emails",
+)
+
+
+def seed_default_settings(apps, schema_editor):
+    """Seed default settings values."""
+    EscalatedSetting = apps.get_model("escalated", "EscalatedSetting")
+    defaults = [
+        ("guest_tickets_enabled", "1"),
+        ("allow_customer_close", "1"),
+        ("auto_close_resolved_after_days", "7"),
+        ("max_attachments_per_reply", "5"),
+        ("max_attachment_size_kb", "10240"),
+    ]
+    # One INSERT; keys that already exist are left untouched.
+    EscalatedSetting.objects.bulk_create(
+        [EscalatedSetting(key=key, value=value) for key, value in defaults],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    replaces = [
+        ("escalated", "0001_initial"),
+        ("escalated", "0002_settings_and_guest_tickets"),
+        ("escalated", "0003_inboundemail"),
+    ]
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Department",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=255)),
+                ("slug", models.SlugField(max_length=255, unique=True)),
+                ("description", models.TextField(blank=True, default="")),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "agents",
+                    models.ManyToManyField(
+                        blank=True, related_name="escalated_departments", to=settings.AUTH_USER_MODEL
+                    ),
+                ),
+            ],
+            options={
+                "db_table": TABLES["departments"],
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="SlaPolicy",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=255)),
+                ("description", models.TextField(blank=True, default="")),
+                ("is_default", models.BooleanField(default=False)),
+                (
+                    "first_response_hours",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Map of priority to hours, e.g."
+                        ' {"low": 24, "medium": 8, "high": 4, "urgent": 1, "critical": 0.5}',
+                    ),
+                ),
+                (
+                    "resolution_hours",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Map of priority to hours, e.g."
+                        ' {"low": 72, "medium": 24, "high": 8, "urgent": 4, "critical": 2}',
+                    ),
+                ),
+                ("business_hours_only", models.BooleanField(default=False)),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": TABLES["sla_policies"],
+                "verbose_name": "SLA Policy",
+                "verbose_name_plural": "SLA Policies",
+            },
+        ),
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=100)),
+                ("slug", models.SlugField(max_length=100, unique=True)),
+                ("color", models.CharField(default="#6b7280", max_length=7)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": TABLES["tags"],
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Ticket",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("requester_object_id", models.PositiveIntegerField(blank=True, null=True)),
+                ("subject", models.CharField(max_length=500)),
+                ("description", models.TextField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("waiting_on_customer", "Waiting on Customer"),
+                            ("waiting_on_agent", "Waiting on Agent"),
+                            ("escalated", "Escalated"),
+                            ("resolved", "Resolved"),
+                            ("closed", "Closed"),
+                            ("reopened", "Reopened"),
+                        ],
+                        default="open",
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "priority",
+                    models.CharField(
+                        choices=[
+                            ("low", "Low"),
+                            ("medium", "Medium"),
+                            ("high", "High"),
+                            ("urgent", "Urgent"),
+                            ("critical", "Critical"),
+                        ],
+                        default="medium",
+                        max_length=20,
+                    ),
+                ),
+                ("channel", models.CharField(default="web", max_length=50)),
+                ("reference", models.CharField(editable=False, max_length=20, unique=True)),
+                ("first_response_at", models.DateTimeField(blank=True, null=True)),
+                ("first_response_due_at", models.DateTimeField(blank=True, null=True)),
+                ("resolution_due_at", models.DateTimeField(blank=True, null=True)),
+                ("sla_first_response_breached", models.BooleanField(default=False)),
+                ("sla_resolution_breached", models.BooleanField(default=False)),
+                ("resolved_at", models.DateTimeField(blank=True, null=True)),
+                ("closed_at", models.DateTimeField(blank=True, null=True)),
+                ("metadata", models.JSONField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("guest_name", models.CharField(blank=True, max_length=255, null=True)),
+                ("guest_email", models.EmailField(blank=True, max_length=254, null=True)),
+                (
+                    "guest_token",
+                    models.CharField(
+                        blank=True,
+                        help_text="Unique token for guest ticket access",
+                        max_length=64,
+                        null=True,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "assigned_to",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="escalated_assigned_tickets",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="tickets",
+                        to="escalated.department",
+                    ),
+                ),
+                (
+                    "requester_content_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="escalated_requester_tickets",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "sla_policy",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="tickets",
+                        to="escalated.slapolicy",
+                    ),
+                ),
+                ("tags", models.ManyToManyField(blank=True, related_name="tickets", to="escalated.tag")),
+            ],
+            options={
+                "db_table": TABLES["tickets"],
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(fields=["status"], name="escalated_t_status_idx"),
+                    models.Index(fields=["priority"], name="escalated_t_priority_idx"),
+                    models.Index(fields=["reference"], name="escalated_t_reference_idx"),
+                    models.Index(fields=["assigned_to"], name="escalated_t_assigned_idx"),
+                    models.Index(fields=["created_at"], name="escalated_t_created_idx"),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="Reply",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("body", models.TextField()),
+                ("is_internal_note", models.BooleanField(default=False)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[("reply", "Reply"), ("note", "Internal Note"), ("system", "System")],
+                        default="reply",
+                        max_length=20,
+                    ),
+                ),
+                ("metadata", models.JSONField(blank=True, null=True)),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="escalated_replies",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "ticket",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="replies", to="escalated.ticket"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": TABLES["replies"],
+                "ordering": ["created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Attachment",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("object_id", models.PositiveIntegerField()),
+                ("file", models.FileField(upload_to="escalated/attachments/%Y/%m/")),
+                ("original_filename", models.CharField(max_length=500)),
+                ("mime_type", models.CharField(blank=True, default="", max_length=255)),
+                ("size", models.PositiveIntegerField(default=0, help_text="File size in bytes")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="escalated_attachments",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": TABLES["attachments"],
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="EscalationRule",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=255)),
+                ("description", models.TextField(blank=True, default="")),
+                (
+                    "trigger_type",
+                    models.CharField(
+                        choices=[
+                            ("sla_breach", "SLA Breach"),
+                            ("priority_change", "Priority Change"),
+                            ("no_response", "No Response"),
+                            ("customer_reply", "Customer Reply"),
+                            ("time_based", "Time Based"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "conditions",
+                    models.JSONField(default=dict, help_text="JSON conditions that must be met for the rule to fire"),
+                ),
+                (
+                    "actions",
+                    models.JSONField(
+                        default=dict,
+                        help_text="JSON actions to take when the rule fires (e.g., assign, notify, change priority)",
+                    ),
+                ),
+                ("order", models.PositiveIntegerField(default=0)),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": TABLES["escalation_rules"],
+                "ordering": ["order", "name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="CannedResponse",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("title", models.CharField(max_length=255)),
+                ("body", models.TextField()),
+                ("category", models.CharField(blank=True, default="", max_length=100)),
+                ("is_shared", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="escalated_canned_responses",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": TABLES["canned_responses"],
+                "ordering": ["category", "title"],
+            },
+        ),
+        migrations.CreateModel(
+            name="TicketActivity",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("causer_object_id", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("status_changed", "Status Changed"),
+                            ("priority_changed", "Priority Changed"),
+                            ("assigned", "Assigned"),
+                            ("unassigned", "Unassigned"),
+                            ("reply_added", "Reply Added"),
+                            ("note_added", "Note Added"),
+                            ("tag_added", "Tag Added"),
+                            ("tag_removed", "Tag Removed"),
+                            ("department_changed", "Department Changed"),
+                            ("escalated", "Escalated"),
+                            ("sla_breached", "SLA Breached"),
+                            ("attachment_added", "Attachment Added"),
+                            ("merged", "Merged"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("properties", models.JSONField(default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "causer_content_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="escalated_activities",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "ticket",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="activities", to="escalated.ticket"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": TABLES["activities"],
+                "ordering": ["-created_at"],
+                "verbose_name_plural": "Ticket activities",
+            },
+        ),
+        migrations.CreateModel(
+            name="EscalatedSetting",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("value", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": TABLES["settings"],
+            },
+        ),
+        migrations.CreateModel(
+            name="InboundEmail",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("message_id", models.CharField(blank=True, max_length=500, null=True, unique=True)),
+                ("from_email", models.CharField(max_length=500)),
+                ("from_name", models.CharField(blank=True, max_length=500, null=True)),
+                ("to_email", models.CharField(max_length=500)),
+                ("subject", models.CharField(max_length=1000)),
+                ("body_text", models.TextField(blank=True, null=True)),
+                ("body_html", models.TextField(blank=True, null=True)),
+                ("raw_headers", models.TextField(blank=True, null=True)),
+                (
+                    "ticket",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="inbound_emails",
+                        to="escalated.ticket",
+                    ),
+                ),
+                (
+                    "reply",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="inbound_emails",
+                        to="escalated.reply",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processed", "Processed"),
+                            ("failed", "Failed"),
+                            ("spam", "Spam"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("adapter", models.CharField(max_length=50)),
+                ("error_message", models.TextField(blank=True, null=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": TABLES["inbound_emails"],
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(fields=["status"], name="escalated_ie_status_idx"),
+                    models.Index(fields=["from_email"], name="escalated_ie_from_idx"),
+                    models.Index(fields=["message_id"], name="escalated_ie_msgid_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(seed_default_settings, migrations.RunPython.noop),
+    ]
@@ -13,8 +13,11 @@ def seed_default_settings(apps, schema_editor):
         ("max_attachments_per_reply", "5"),
         ("max_attachment_size_kb", "10240"),
     ]
-    for key, value in defaults:
-        EscalatedSetting.objects.get_or_create(key=key, defaults={"value": value})
+    # One INSERT; keys that already exist are left untouched.
+    EscalatedSetting.objects.bulk_create(
+        [EscalatedSetting(key=key, value=value) for key, value in defaults],
+        ignore_conflicts=True,
+    )
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,50 @@
+"""Replace Ticket's single-column indexes with query-shaped composites.
+
+The hot ticket list queries filter on status (and priority or assignee) and
+order by created_at. Each single-column index could only satisfy one of those
+predicates, so these become composite indexes with created_at as the ordered
+suffix. The reference index duplicated the btree already backing its unique
+constraint, and the assignee index duplicated the foreign key's own index.
+
+On PostgreSQL a partial index over open tickets is added as well, so queue
+views scan only the (small) set of unresolved tickets. Indexes are built and
+dropped CONCURRENTLY there so the tickets table stays writable throughout.
+"""
+
+from django.db import migrations, models
+
+from escalated.conf import get_table_name
+from escalated.migrations._operations import AddIndexConcurrently, RemoveIndexConcurrently, RunPostgresSQL
+
+OPEN_STATUSES = ("open", "in_progress", "waiting_on_customer", "waiting_on_agent", "escalated", "reopened")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0026_newsletter_uuid_user_columns"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="ticket",
+            index=models.Index(fields=["status", "priority", "-created_at"], name="esc_t_spc_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="ticket",
+            index=models.Index(fields=["assigned_to", "status", "-created_at"], name="esc_t_asc_idx"),
+        ),
+        RemoveIndexConcurrently(model_name="ticket", name="escalated_t_status_idx"),
+        RemoveIndexConcurrently(model_name="ticket", name="escalated_t_priority_idx"),
+        RemoveIndexConcurrently(model_name="ticket", name="escalated_t_reference_idx"),
+        RemoveIndexConcurrently(model_name="ticket", name="escalated_t_assigned_idx"),
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_t_open_idx "
+                f"ON {get_table_name('tickets')} (created_at DESC) "
+                f"WHERE status IN ({', '.join(repr(s) for s in OPEN_STATUSES)})"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_t_open_idx",
+        ),
+    ]
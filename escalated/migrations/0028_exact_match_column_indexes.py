@@ -0,0 +1,30 @@
+"""Trim redundant indexes on exact-match lookup columns.
+
+Ticket.reference, Ticket.guest_token and InboundEmail.message_id are unique
+and only ever looked up by equality. The unique constraint's btree already
+serves those lookups, so:
+
+* escalated_ie_msgid_idx duplicated the unique index on message_id, and
+* on PostgreSQL, the varchar_pattern_ops "_like" index Django adds beside
+  each unique CharField only helps LIKE 'prefix%' queries, which never run
+  against these columns.
+"""
+
+from django.db import migrations
+
+from escalated.migrations._operations import DropLikeIndex, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0027_ticket_composite_indexes"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(model_name="inboundemail", name="escalated_ie_msgid_idx"),
+        DropLikeIndex(model_name="ticket", field_name="reference"),
+        DropLikeIndex(model_name="ticket", field_name="guest_token"),
+        DropLikeIndex(model_name="inboundemail", field_name="message_id"),
+    ]
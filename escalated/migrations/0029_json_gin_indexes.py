@@ -0,0 +1,42 @@
+"""Add GIN indexes for JSON containment lookups on PostgreSQL.
+
+Ticket.metadata and TicketActivity.properties are the JSON columns that get
+filtered with ``__contains`` (e.g. ``metadata__contains={"sla_id": 5}``);
+without an index each such filter is a sequential scan. jsonb_path_ops keeps
+the index small and supports exactly the ``@>`` operator those lookups use.
+
+Small configuration JSON (SLA hours, escalation conditions/actions) is read
+once per evaluation and stays unindexed. Other backends are unaffected.
+"""
+
+from django.db import migrations
+
+from escalated.conf import get_table_names
+from escalated.migrations._operations import RunPostgresSQL
+
+TABLES = get_table_names("tickets", "activities")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0028_exact_match_column_indexes"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_t_meta_gin "
+                f"ON {TABLES['tickets']} USING GIN (metadata jsonb_path_ops)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_t_meta_gin",
+        ),
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_act_props_gin "
+                f"ON {TABLES['activities']} USING GIN (properties jsonb_path_ops)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_act_props_gin",
+        ),
+    ]
@@ -0,0 +1,37 @@
+"""Widen Attachment.size and index live replies per ticket.
+
+Attachment.size was a 32-bit PositiveIntegerField, which overflows for files
+larger than 2 GiB on most backends. On PostgreSQL, Reply gets a partial
+(ticket, created_at) index restricted to non-deleted rows, matching how every
+ticket view loads its thread; like the other partial indexes it stays out of
+model state. (0036 replaces it with a full index on the same key.)
+"""
+
+from django.db import migrations, models
+
+from escalated.conf import get_table_name
+from escalated.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0029_json_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="attachment",
+            name="size",
+            field=models.PositiveBigIntegerField(default=0, help_text="File size in bytes"),
+        ),
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_reply_live_idx "
+                f"ON {get_table_name('replies')} (ticket_id, created_at) "
+                "WHERE NOT is_deleted"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_reply_live_idx",
+        ),
+    ]
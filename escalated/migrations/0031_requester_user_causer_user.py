@@ -0,0 +1,76 @@
+"""Add concrete user FKs alongside the requester/causer generic relations.
+
+Generic foreign keys can't be joined, so every ticket or activity rendered
+in a list resolved its requester/causer with a separate query. The generic
+relations stay (any model may still be a requester); requester_user and
+causer_user mirror them whenever they point at AUTH_USER_MODEL so list views
+can select_related() the user.
+
+The backfill issues one UPDATE per distinct user and is safe to re-run.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import migrations, models
+
+
+def _backfill(apps, model_name, ct_field, oid_field, user_field):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Model = apps.get_model("escalated", model_name)
+
+    user_ct = ContentType.objects.filter(app_label=User._meta.app_label, model=User._meta.model_name).first()
+    if user_ct is None:
+        return
+
+    pending = Model.objects.filter(**{ct_field: user_ct, f"{user_field}__isnull": True})
+    object_ids = pending.exclude(**{f"{oid_field}__isnull": True}).values_list(oid_field, flat=True).distinct()
+    for object_id in object_ids.iterator():
+        try:
+            user_pk = User._meta.pk.to_python(object_id)
+        except ValidationError:
+            continue
+        if not User.objects.filter(pk=user_pk).exists():
+            continue
+        pending.filter(**{oid_field: object_id}).update(**{f"{user_field}_id": user_pk})
+
+
+def backfill(apps, schema_editor):
+    _backfill(apps, "Ticket", "requester_content_type", "requester_object_id", "requester_user")
+    _backfill(apps, "TicketActivity", "causer_content_type", "causer_object_id", "causer_user")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("escalated", "0030_attachment_bigint_size_reply_live_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticket",
+            name="requester_user",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=models.deletion.SET_NULL,
+                related_name="escalated_requested_tickets",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="ticketactivity",
+            name="causer_user",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+"""Add BRIN indexes on created_at for append-only log tables (PostgreSQL).
+
+Activity and inbound-email rows are inserted in created_at order and only
+ever range-scanned by age (retention purges, "older than N days" reports),
+which is exactly what BRIN is for: a few kilobytes per gigabyte of table
+instead of a full btree.
+
+Ticket keeps its created_at btree; list views ORDER BY created_at DESC
+LIMIT n, and only a btree can return rows in index order.
+"""
+
+from django.db import migrations
+
+from escalated.conf import get_table_names
+from escalated.migrations._operations import RunPostgresSQL
+
+TABLES = get_table_names("activities", "inbound_emails")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0031_requester_user_causer_user"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_act_created_brin "
+                f"ON {TABLES['activities']} USING BRIN (created_at) WITH (pages_per_range = 64)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_act_created_brin",
+        ),
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_ie_created_brin "
+                f"ON {TABLES['inbound_emails']} USING BRIN (created_at) WITH (pages_per_range = 64)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_ie_created_brin",
+        ),
+    ]
@@ -0,0 +1,26 @@
+"""Index Attachment's generic parent columns together.
+
+ticket.attachments / reply.attachments (and their prefetches) filter on
+``content_type_id = X AND object_id IN (...)``. Only content_type had an
+index, and with just two parent types it matches half the table; the
+composite index turns each lookup into a direct range scan.
+"""
+
+from django.db import migrations, models
+
+from escalated.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0032_brin_created_at_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="attachment",
+            index=models.Index(fields=["content_type", "object_id"], name="esc_att_parent_idx"),
+        ),
+    ]
@@ -0,0 +1,49 @@
+"""Leave free space in the InboundEmail.message_id unique index (PostgreSQL).
+
+Message-IDs arrive in effectively random order, so every insert lands on an
+arbitrary leaf of the unique btree and full leaves split. A fillfactor of 70
+leaves room on each page for those inserts. The setting applies to pages
+written from now on; a later REINDEX applies it to the existing index.
+
+A hash index can't replace this btree: PostgreSQL hash indexes don't support
+uniqueness, which the dedupe-by-Message-ID logic depends on.
+"""
+
+from django.db import migrations
+
+
+def _message_id_unique_indexes(schema_editor, model):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    # A unique constraint's backing index shares the constraint's name.
+    return [name for name, info in constraints.items() if info["unique"] and info["columns"] == ["message_id"]]
+
+
+def _set_fillfactor(apps, schema_editor, value):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    InboundEmail = apps.get_model("escalated", "InboundEmail")
+    for name in _message_id_unique_indexes(schema_editor, InboundEmail):
+        if value is None:
+            schema_editor.execute(f"ALTER INDEX {schema_editor.quote_name(name)} RESET (fillfactor)")
+        else:
+            schema_editor.execute(f"ALTER INDEX {schema_editor.quote_name(name)} SET (fillfactor = {value})")
+
+
+def forwards(apps, schema_editor):
+    _set_fillfactor(apps, schema_editor, 70)
+
+
+def backwards(apps, schema_editor):
+    _set_fillfactor(apps, schema_editor, None)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("escalated", "0033_attachment_parent_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,53 @@
+"""Index replies by (ticket, created_at) and make it the clustering index.
+
+Replies are read almost exclusively as "all replies for ticket X in order".
+The composite index replaces the foreign key's single-column index (it leads
+with ticket_id) and the partial live-reply index from 0030, which had the
+same key and so only doubled the index maintenance on every insert. On
+PostgreSQL it is marked as the table's clustering index (CLUSTER needs a
+non-partial index). That is metadata only: nothing is rewritten here, but a later
+``CLUSTER`` (or ``pg_repack --order-by``) run by the DBA will co-locate each
+ticket's replies on the same heap pages.
+"""
+
+from django.db import migrations, models
+
+from escalated.conf import get_table_name
+from escalated.migrations._operations import AddIndexConcurrently, RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0035_lz4_toast_compression"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="reply",
+            index=models.Index(fields=["ticket", "created_at"], name="esc_reply_tc_idx"),
+        ),
+        RunPostgresSQL(
+            sql="DROP INDEX CONCURRENTLY IF EXISTS esc_reply_live_idx",
+            reverse_sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_reply_live_idx "
+                f"ON {get_table_name('replies')} (ticket_id, created_at) "
+                "WHERE NOT is_deleted"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="reply",
+            name="ticket",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=models.deletion.CASCADE,
+                related_name="replies",
+                to="escalated.ticket",
+            ),
+        ),
+        RunPostgresSQL(
+            sql=f"ALTER TABLE {get_table_name('replies')} CLUSTER ON esc_reply_tc_idx",
+            reverse_sql=f"ALTER TABLE {get_table_name('replies')} SET WITHOUT CLUSTER",
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""Require resolved tickets to carry a resolved_at timestamp.
+
+Workflow and automation status changes, and imports, used to set
+``status="resolved"`` without stamping ``resolved_at``, so those tickets were
+missing from every resolution-time report. Existing rows are backfilled from
+``updated_at`` before the check is added. On PostgreSQL the constraint is added
+``NOT VALID`` and validated separately, so the tickets table stays writable
+while existing rows are checked.
+"""
+
+import django
+from django.db import migrations, models
+from django.db.models import F
+
+from escalated.migrations._operations import AddConstraintNotValid
+
+# Django 5.1 renamed `check=` to `condition=` on CheckConstraint.
+_condition = ~models.Q(status="resolved") | models.Q(resolved_at__isnull=False)
+_check_kwargs = {"condition": _condition} if django.VERSION >= (5, 1) else {"check": _condition}
+
+
+def backfill_resolved_at(apps, schema_editor):
+    Ticket = apps.get_model("escalated", "Ticket")
+    Ticket.objects.filter(status="resolved", resolved_at__isnull=True).update(resolved_at=F("updated_at"))
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0036_reply_ticket_created_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_resolved_at, migrations.RunPython.noop),
+        AddConstraintNotValid(
+            model_name="ticket",
+            constraint=models.CheckConstraint(
+                **_check_kwargs,
+                name="esc_t_resolved_has_ts",
+            ),
+        ),
+    ]
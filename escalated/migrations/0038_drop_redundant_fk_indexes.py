@@ -0,0 +1,44 @@
+"""Drop foreign key indexes that other indexes already cover.
+
+``ticket_followers.ticket_id`` is the leading column of the (ticket, user)
+unique constraint, so its single-column index was never chosen over the
+composite and only added write and vacuum cost. ``api_tokens`` are
+authenticated by token hash; the only owner lookup, deleting a user's tokens,
+filters on content type *and* object id and is served by the composite
+``esc_tok_owner_idx`` added in 0048 rather than this single-column index.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("escalated", "0037_ticket_resolved_at_check"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ticketfollower",
+            name="ticket",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ticket_followers",
+                to="escalated.ticket",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="apitoken",
+            name="tokenable_content_type",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="escalated_api_tokens",
+                to="contenttypes.contenttype",
+            ),
+        ),
+    ]
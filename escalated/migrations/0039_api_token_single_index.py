@@ -0,0 +1,29 @@
+"""Leave api_tokens.token with a single index.
+
+Every authenticated API request looks its token up by SHA-256 hex digest,
+an exact match. The unique constraint's btree serves that on its own; the
+PostgreSQL varchar_pattern_ops "_like" index beside it only helps prefix
+LIKE queries and is dropped. ``db_index=True`` was redundant with
+``unique=True`` and is removed from the field (no database change).
+"""
+
+from django.db import migrations, models
+
+from escalated.migrations._operations import DropLikeIndex
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0038_drop_redundant_fk_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apitoken",
+            name="token",
+            field=models.CharField(max_length=64, unique=True),
+        ),
+        DropLikeIndex(model_name="apitoken", field_name="token"),
+    ]
@@ -0,0 +1,32 @@
+"""Drop the index on SatisfactionRating.rated_by_content_type.
+
+The rater is only ever read back from a rating row; nothing filters ratings
+by the rater's content type, so the index only cost writes, and no owner
+index replaces it because no query enumerates ratings per owner. (Tokens are
+different: they are deleted per owner, see 0048.)
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("escalated", "0039_api_token_single_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="satisfactionrating",
+            name="rated_by_content_type",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="escalated_satisfaction_ratings",
+                to="contenttypes.contenttype",
+            ),
+        ),
+    ]
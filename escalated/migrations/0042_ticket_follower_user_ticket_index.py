@@ -0,0 +1,40 @@
+"""Index ticket followers by (user, ticket).
+
+The "following" filter on the ticket lists joins ticket_followers on
+``user_id = %s`` and needs nothing but ``ticket_id`` back. Replacing the
+user foreign key's single-column index with (user_id, ticket_id) lets
+PostgreSQL answer that with an index-only scan; every other backend still
+gets an index led by user_id.
+"""
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from escalated.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("escalated", "0041_rating_created_brin"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="ticketfollower",
+            index=models.Index(fields=["user", "ticket"], name="esc_tf_user_ticket_idx"),
+        ),
+        migrations.AlterField(
+            model_name="ticketfollower",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="escalated_followed_tickets",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
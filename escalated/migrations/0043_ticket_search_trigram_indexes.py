@@ -0,0 +1,43 @@
+"""Add trigram GIN indexes for ticket search (PostgreSQL).
+
+``TicketQuerySet.search`` ORs three ``__icontains`` lookups, which PostgreSQL
+runs as ``UPPER(col::text) LIKE UPPER('%term%')``. No btree can serve a
+leading wildcard, so every search was a sequential scan of tickets. pg_trgm
+GIN indexes over the same ``UPPER(col::text)`` expressions let the planner
+answer each branch with a bitmap index scan; the query itself is unchanged.
+
+The extension is left installed on reverse, since other apps may use it.
+"""
+
+from django.db import migrations
+
+from escalated.conf import get_table_name
+from escalated.migrations._operations import RunPostgresSQL
+
+SEARCH_COLUMNS = {
+    "esc_t_subject_trgm": "subject",
+    "esc_t_description_trgm": "description",
+    "esc_t_reference_trgm": "reference",
+}
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0042_ticket_follower_user_ticket_index"),
+    ]
+
+    operations = [
+        RunPostgresSQL(sql="CREATE EXTENSION IF NOT EXISTS pg_trgm", reverse_sql=migrations.RunSQL.noop),
+        *(
+            RunPostgresSQL(
+                sql=(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {get_table_name('tickets')} USING GIN (UPPER({column}::text) gin_trgm_ops)"
+                ),
+                reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {name}",
+            )
+            for name, column in SEARCH_COLUMNS.items()
+        ),
+    ]
@@ -0,0 +1,39 @@
+"""Index tickets by (department, status, -created_at).
+
+Department queues filter on department and status and list newest first,
+like the status and assignee composites added in 0027. The department
+foreign key's single-column index is dropped since the composite leads with
+department_id.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from escalated.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0043_ticket_search_trigram_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="ticket",
+            index=models.Index(fields=["department", "status", "-created_at"], name="esc_t_dsc_idx"),
+        ),
+        migrations.AlterField(
+            model_name="ticket",
+            name="department",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="tickets",
+                to="escalated.department",
+            ),
+        ),
+    ]
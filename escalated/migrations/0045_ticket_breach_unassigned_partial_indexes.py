@@ -0,0 +1,40 @@
+"""Add partial indexes for the SLA-breach and unassigned ticket queues.
+
+Only a small share of tickets is breached or unassigned at any time, so
+indexing just those rows (ordered newest first, as the queues list them)
+keeps both indexes small enough to stay cached. Like esc_t_open_idx (0027)
+they are created on PostgreSQL only and kept out of model state, so
+backends without partial index support neither build nor warn about them.
+"""
+
+from django.db import migrations
+
+from escalated.conf import get_table_name
+from escalated.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0044_ticket_department_status_index"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_t_breach_idx "
+                f"ON {get_table_name('tickets')} (created_at DESC) "
+                "WHERE sla_first_response_breached OR sla_resolution_breached"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_t_breach_idx",
+        ),
+        RunPostgresSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS esc_t_unassigned_idx "
+                f"ON {get_table_name('tickets')} (created_at DESC) "
+                "WHERE assigned_to_id IS NULL"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS esc_t_unassigned_idx",
+        ),
+    ]
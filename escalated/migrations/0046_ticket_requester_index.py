@@ -0,0 +1,41 @@
+"""Index tickets by their generic requester.
+
+The customer portal, the requester ticket count and Contact promotion all
+filter on (requester_content_type, requester_object_id). Only the content
+type was indexed, and it has a handful of distinct values, so those lookups
+scanned every ticket of that type. The composite replaces the content type's
+own index, which it leads with.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from escalated.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("escalated", "0045_ticket_breach_unassigned_partial_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="ticket",
+            index=models.Index(fields=["requester_content_type", "requester_object_id"], name="esc_t_requester_idx"),
+        ),
+        migrations.AlterField(
+            model_name="ticket",
+            name="requester_content_type",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="escalated_requester_tickets",
+                to="contenttypes.contenttype",
+            ),
+        ),
+    ]
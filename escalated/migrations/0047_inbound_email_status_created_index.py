@@ -0,0 +1,26 @@
+"""Index inbound emails by (status, -created_at).
+
+Inbound emails are always listed newest first, and reviewing the pending or
+failed queue filters on status as well. The composite serves both the filter
+and the ordering, and replaces the single-column status index it leads with.
+"""
+
+from django.db import migrations, models
+
+from escalated.migrations._operations import AddIndexConcurrently, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0046_ticket_requester_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inboundemail",
+            index=models.Index(fields=["status", "-created_at"], name="esc_ie_status_created_idx"),
+        ),
+        RemoveIndexConcurrently(model_name="inboundemail", name="escalated_ie_status_idx"),
+    ]
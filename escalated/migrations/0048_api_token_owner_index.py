@@ -0,0 +1,26 @@
+"""Index API tokens by their generic owner.
+
+Deleting a user removes their tokens with a filter on
+(tokenable_content_type, tokenable_object_id). 0038 dropped the content
+type's index on the assumption that tokens are only looked up by hash, so
+that delete scanned the whole token table on every user deletion.
+"""
+
+from django.db import migrations, models
+
+from escalated.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("escalated", "0047_inbound_email_status_created_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="apitoken",
+            index=models.Index(fields=["tokenable_content_type", "tokenable_object_id"], name="esc_tok_owner_idx"),
+        ),
+    ]
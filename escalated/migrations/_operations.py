@@ -0,0 +1,157 @@
+"""
+Custom migration operations shared by Escalated's migrations.
+
+The migration loader skips modules whose names start with an underscore,
+so this file is importable from migrations without being treated as one.
+
+Escalated supports every database Django does, but some physical tuning
+(GIN/BRIN/hash indexes, covering indexes, CONCURRENTLY builds) only exists
+on PostgreSQL. These operations let a migration express that tuning while
+remaining a no-op, or falling back to the portable equivalent, elsewhere.
+"""
+
+from django.db import migrations
+from django.db.migrations.operations.base import Operation
+
+
+def is_postgresql(schema_editor):
+    return schema_editor.connection.vendor == "postgresql"
+
+
+class RunPostgresSQL(migrations.RunSQL):
+    """
+    ``RunSQL`` that only executes on PostgreSQL.
+
+    Use for physical-only changes (index types, storage parameters) that
+    don't alter Django's model state; other backends skip the statements.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgresql(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgresql(schema_editor):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return "Raw PostgreSQL operation"
+
+
+class DropLikeIndex(Operation):
+    """
+    Drop the ``varchar_pattern_ops`` index PostgreSQL's schema editor adds
+    next to every indexed or unique ``CharField``.
+
+    That index only serves ``LIKE 'prefix%'`` lookups. Columns that are only
+    ever matched exactly (tokens, references, message ids) pay for it on every
+    write and in buffer cache for nothing. Model state is unchanged; reversing
+    recreates the index. The drop is CONCURRENT, so the enclosing migration
+    must set ``atomic = False``.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name, field_name):
+        self.model_name = model_name
+        self.field_name = field_name
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _index_name(self, schema_editor, model, field):
+        return schema_editor._create_index_name(model._meta.db_table, [field.column], suffix="_like")
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            field = model._meta.get_field(self.field_name)
+            name = self._index_name(schema_editor, model, field)
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}")
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            field = model._meta.get_field(self.field_name)
+            statement = schema_editor._create_like_index_sql(model, field)
+            if statement is not None:
+                schema_editor.execute(statement)
+
+    def describe(self):
+        return f"Drop pattern-ops index on {self.model_name}.{self.field_name}"
+
+    def deconstruct(self):
+        return self.__class__.__name__, [], {"model_name": self.model_name, "field_name": self.field_name}
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """
+    ``AddIndex`` that builds with ``CREATE INDEX CONCURRENTLY`` on PostgreSQL,
+    so the table stays writable during the build. Other backends get a plain
+    ``CREATE INDEX``. The enclosing migration must set ``atomic = False``.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+
+class RemoveIndexConcurrently(migrations.RemoveIndex):
+    """
+    ``RemoveIndex`` that drops with ``DROP INDEX CONCURRENTLY`` on PostgreSQL.
+    The enclosing migration must set ``atomic = False``.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            model_state = from_state.models[app_label, self.model_name_lower]
+            index = model_state.get_index_by_name(self.name)
+            schema_editor.remove_index(model, index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            model_state = to_state.models[app_label, self.model_name_lower]
+            index = model_state.get_index_by_name(self.name)
+            schema_editor.add_index(model, index, concurrently=True)
+
+
+class AddConstraintNotValid(migrations.AddConstraint):
+    """
+    ``AddConstraint`` for check constraints that, on PostgreSQL, adds the
+    constraint ``NOT VALID`` and then validates it as a separate statement.
+
+    Adding it ``NOT VALID`` needs only a brief lock; ``VALIDATE CONSTRAINT``
+    then scans existing rows under ``SHARE UPDATE EXCLUSIVE``, so writes carry
+    on during the scan. The enclosing migration must set ``atomic = False``
+    for the two steps to run in separate transactions.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgresql(schema_editor):
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            table = schema_editor.quote_name(model._meta.db_table)
+            name = schema_editor.quote_name(self.constraint.name)
+            schema_editor.execute(f"{self.constraint.create_sql(model, schema_editor)} NOT VALID")
+            schema_editor.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
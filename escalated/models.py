@@ -2,17 +2,64 @@ import hashlib
 import secrets
 import uuid
 
+import django
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from escalated.conf import get_table_name
 
+# Django 5.1 renamed `check=` to `condition=` on CheckConstraint.
+_CHECK_KWARG = "condition" if django.VERSION >= (5, 1) else "check"
+
+# Stored values EscalatedSetting.get_bool() treats as true (case-insensitive).
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+# TicketQuerySet.breached_sla() predicate. Keep it in step with the WHERE
+# clause of the esc_t_breach_idx partial index (migration 0045), or
+# PostgreSQL will not use that index for the SLA queue.
+_BREACHED_Q = Q(sla_first_response_breached=True) | Q(sla_resolution_breached=True)
+
+
+def _user_pk_candidate(content_type_id, object_id):
+    """
+    Return the host user primary key a generic (content_type, object_id) pair
+    names, or None when it references some other model. Does not check that
+    the user still exists.
+    """
+    if content_type_id is None or object_id in (None, ""):
+        return None
+    User = get_user_model()
+    if content_type_id != ContentType.objects.get_for_model(User).pk:
+        return None
+    try:
+        return User._meta.pk.to_python(object_id)
+    except ValidationError:
+        return None
+
+
+def _user_pk_for(content_type_id, object_id, cached=None):
+    """
+    Return the primary key of the existing host user a generic pair points
+    at, or None. The generic columns outlive a deleted user, so the pk is
+    only trusted when *cached* is that user or the row is still there.
+    """
+    pk = _user_pk_candidate(content_type_id, object_id)
+    if pk is None or getattr(cached, "pk", None) == pk:
+        return pk
+    if not get_user_model()._default_manager.filter(pk=pk).exists():
+        return None
+    return pk
+
+
 # ---------------------------------------------------------------------------
 # Managers / QuerySets
 # ---------------------------------------------------------------------------
@@ -20,19 +67,10 @@ from escalated.conf import get_table_name
 
 class TicketQuerySet(models.QuerySet):
     def open(self):
-        return self.filter(
-            status__in=[
-                Ticket.Status.OPEN,
-                Ticket.Status.IN_PROGRESS,
-                Ticket.Status.WAITING_ON_CUSTOMER,
-                Ticket.Status.WAITING_ON_AGENT,
-                Ticket.Status.ESCALATED,
-                Ticket.Status.REOPENED,
-            ]
-        )
+        return self.filter(status__in=Ticket.OPEN_STATUSES)
 
     def closed(self):
-        return self.filter(status__in=[Ticket.Status.RESOLVED, Ticket.Status.CLOSED])
+        return self.filter(status__in=Ticket.CLOSED_STATUSES)
 
     def unassigned(self):
         return self.filter(assigned_to__isnull=True)
@@ -41,7 +79,7 @@ class TicketQuerySet(models.QuerySet):
         return self.filter(assigned_to_id=user_id)
 
     def breached_sla(self):
-        return self.filter(Q(sla_first_response_breached=True) | Q(sla_resolution_breached=True))
+        return self.filter(_BREACHED_Q)
 
     def search(self, term):
         return self.filter(Q(subject__icontains=term) | Q(description__icontains=term) | Q(reference__icontains=term))
@@ -58,6 +96,20 @@ class TicketQuerySet(models.QuerySet):
     def by_ticket_type(self, ticket_type):
         return self.filter(ticket_type=ticket_type)
 
+    _FILTER_BY_FIELDS = {
+        "status": "status",
+        "priority": "priority",
+        "assigned_to": "assigned_to_id",
+        "department": "department_id",
+    }
+
+    def filter_by(self, **criteria):
+        """
+        Apply any of status, priority, assigned_to and department in a
+        single filter() call instead of one clone per chained method.
+        """
+        return self.filter(**{self._FILTER_BY_FIELDS[key]: value for key, value in criteria.items()})
+
     def followed_by(self, user_id):
         """Filter tickets that are followed by a specific user."""
         return self.filter(ticket_followers__user_id=user_id)
@@ -74,46 +126,47 @@ class TicketQuerySet(models.QuerySet):
         """Return tickets whose snooze period has expired."""
         return self.filter(snoozed_until__isnull=False, snoozed_until__lte=timezone.now())
 
-    def live_chats(self):
-        """Return tickets that are live chat conversations."""
-        return self.filter(channel="chat", chat_ended_at__isnull=True).exclude(
-            status__in=[Ticket.Status.RESOLVED, Ticket.Status.CLOSED]
-        )
-
-
-class TicketManager(models.Manager):
-    def get_queryset(self):
-        return TicketQuerySet(self.model, using=self._db)
-
-    def open(self):
-        return self.get_queryset().open()
+    def without_bodies(self):
+        """
+        Leave the large text/JSON columns (description, metadata,
+        chat_metadata) unloaded, for list views and background scans that
+        never read them.
+        """
+        return self.defer("description", "metadata", "chat_metadata")
 
-    def closed(self):
-        return self.get_queryset().closed()
+    def in_pk_chunks(self, size=2000):
+        """
+        Yield the tickets in pk order, one fully fetched list at a time.
 
-    def unassigned(self):
-        return self.get_queryset().unassigned()
+        For sweeps that save tickets as they go: each chunk is read before
+        any write, so no cursor is held open on the table being updated
+        (SQLite does not isolate a streaming read from writes on the same
+        connection).
+        """
+        last_pk = 0
+        while True:
+            chunk = list(self.filter(pk__gt=last_pk).order_by("pk")[:size])
+            if not chunk:
+                return
+            yield chunk
+            last_pk = chunk[-1].pk
 
-    def assigned_to(self, user_id):
-        return self.get_queryset().assigned_to(user_id)
+    def live_chats(self):
+        """Return tickets that are live chat conversations."""
+        return self.filter(channel="chat", chat_ended_at__isnull=True).exclude(status__in=Ticket.CLOSED_STATUSES)
 
-    def breached_sla(self):
-        return self.get_queryset().breached_sla()
 
-    def search(self, term):
-        return self.get_queryset().search(term)
+# Every TicketQuerySet method is available on Ticket.objects.
+TicketManager = models.Manager.from_queryset(TicketQuerySet)
 
-    def live_chats(self):
-        return self.get_queryset().live_chats()
 
-    def snoozed(self):
-        return self.get_queryset().snoozed()
+class ReplyQuerySet(models.QuerySet):
+    def visible(self):
+        """Exclude soft-deleted replies."""
+        return self.filter(is_deleted=False)
 
-    def not_snoozed(self):
-        return self.get_queryset().not_snoozed()
 
-    def snooze_expired(self):
-        return self.get_queryset().snooze_expired()
+ReplyManager = models.Manager.from_queryset(ReplyQuerySet)
 
 
 # ---------------------------------------------------------------------------
@@ -249,6 +302,8 @@ class Contact(models.Model):
         Ticket.objects.filter(contact_id=self.id).update(
             requester_content_type=ct,
             requester_object_id=user_id,
+            requester_user_id=_user_pk_for(ct.pk, user_id),
+            updated_at=timezone.now(),
         )
         return self
 
@@ -264,6 +319,18 @@ class Ticket(models.Model):
         CLOSED = "closed", _("Closed")
         REOPENED = "reopened", _("Reopened")
 
+    OPEN_STATUSES = frozenset(
+        {
+            Status.OPEN,
+            Status.IN_PROGRESS,
+            Status.WAITING_ON_CUSTOMER,
+            Status.WAITING_ON_AGENT,
+            Status.ESCALATED,
+            Status.REOPENED,
+        }
+    )
+    CLOSED_STATUSES = frozenset({Status.RESOLVED, Status.CLOSED})
+
     class Priority(models.TextChoices):
         LOW = "low", _("Low")
         MEDIUM = "medium", _("Medium")
@@ -278,15 +345,28 @@ class Ticket(models.Model):
         TASK = "task", _("Task")
 
     # Requester via GenericForeignKey so any user model works
+    # Indexed by esc_t_requester_idx, which leads with the content type.
     requester_content_type = models.ForeignKey(
         ContentType,
         on_delete=models.CASCADE,
         null=True,
         blank=True,
         related_name="escalated_requester_tickets",
+        db_index=False,
     )
     requester_object_id = models.CharField(max_length=255, null=True, blank=True)
     requester = GenericForeignKey("requester_content_type", "requester_object_id")
+    # Mirror of ``requester`` when it is the host user model. Kept in sync on
+    # save so list views can select_related() it instead of resolving the
+    # generic relation once per row.
+    requester_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="escalated_requested_tickets",
+    )
 
     assigned_to = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -295,12 +375,14 @@ class Ticket(models.Model):
         blank=True,
         related_name="escalated_assigned_tickets",
     )
+    # Indexed by esc_t_dsc_idx, which leads with department.
     department = models.ForeignKey(
         Department,
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
         related_name="tickets",
+        db_index=False,
     )
     sla_policy = models.ForeignKey(
         SlaPolicy,
@@ -400,13 +482,24 @@ class Ticket(models.Model):
         db_table = get_table_name("tickets")
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["status"]),
-            models.Index(fields=["priority"]),
-            models.Index(fields=["reference"]),
-            models.Index(fields=["assigned_to"]),
+            models.Index(fields=["status", "priority", "-created_at"], name="esc_t_spc_idx"),
+            models.Index(fields=["assigned_to", "status", "-created_at"], name="esc_t_asc_idx"),
+            models.Index(fields=["department", "status", "-created_at"], name="esc_t_dsc_idx"),
+            models.Index(fields=["requester_content_type", "requester_object_id"], name="esc_t_requester_idx"),
+            # The partial indexes (esc_t_open_idx, esc_t_breach_idx,
+            # esc_t_unassigned_idx) are PostgreSQL-only and live in the
+            # migrations, outside model state.
             models.Index(fields=["ticket_type"]),
             models.Index(fields=["created_at"]),
         ]
+        constraints = [
+            # Reports measure resolution time from resolved_at; a resolved
+            # ticket without it silently drops out of them.
+            models.CheckConstraint(
+                **{_CHECK_KWARG: ~Q(status="resolved") | Q(resolved_at__isnull=False)},
+                name="esc_t_resolved_has_ts",
+            ),
+        ]
 
     def __str__(self):
         return f"[{self.reference}] {self.subject}"
@@ -414,27 +507,58 @@ class Ticket(models.Model):
     def save(self, *args, **kwargs):
         if not self.reference:
             self.reference = self.generate_reference()
+        update_fields = kwargs.get("update_fields")
+        # esc_t_resolved_has_ts requires a timestamp on resolved tickets;
+        # stamp it for callers (plugins, host code) that only set status.
+        if self.status == self.Status.RESOLVED and self.resolved_at is None:
+            self.resolved_at = timezone.now()
+            if update_fields is not None:
+                update_fields = kwargs["update_fields"] = {*update_fields, "resolved_at"}
+        requester = (self.requester_content_type_id, self.requester_object_id)
+        if update_fields is None:
+            # Only re-derive the mirror when the generic pair moved; the pair
+            # keeps a deleted user's pk after SET_NULL cleared the mirror.
+            refresh = self._state.adding or requester != getattr(self, "_saved_requester", None)
+        else:
+            refresh = bool({"requester_content_type", "requester_object_id"} & set(update_fields))
+        if refresh:
+            self.requester_user_id = _user_pk_for(*requester, cached=Ticket.requester.get_cached_value(self, None))
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "requester_user"}
         super().save(*args, **kwargs)
+        self._saved_requester = requester
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._saved_requester = (
+            instance.__dict__.get("requester_content_type_id"),
+            instance.__dict__.get("requester_object_id"),
+        )
+        return instance
+
+    def get_requester(self):
+        """Return the requester, preferring the concrete user FK over the generic relation."""
+        if self.requester_user_id is not None:
+            return self.requester_user
+        return self.requester
 
     @classmethod
     def generate_reference(cls):
         """Generate a unique ticket reference like ESC-A1B2C3."""
         prefix = EscalatedSetting.get("ticket_reference_prefix", "ESC")
+        # Probe a handful of candidates per query, so a collision costs no
+        # extra round trip.
         while True:
-            ref = f"{prefix}-{uuid.uuid4().hex[:6].upper()}"
-            if not cls.objects.filter(reference=ref).exists():
-                return ref
+            candidates = [f"{prefix}-{secrets.token_hex(3).upper()}" for _ in range(8)]
+            taken = set(cls.objects.filter(reference__in=candidates).values_list("reference", flat=True))
+            for ref in candidates:
+                if ref not in taken:
+                    return ref
 
     @property
     def is_open(self):
-        return self.status in [
-            self.Status.OPEN,
-            self.Status.IN_PROGRESS,
-            self.Status.WAITING_ON_CUSTOMER,
-            self.Status.WAITING_ON_AGENT,
-            self.Status.ESCALATED,
-            self.Status.REOPENED,
-        ]
+        return self.status in self.OPEN_STATUSES
 
     @property
     def is_resolved(self):
@@ -452,7 +576,7 @@ class Ticket(models.Model):
     @property
     def is_guest(self):
         """Check if this is a guest ticket (no authenticated requester)."""
-        return self.requester_content_type is None and self.guest_token is not None
+        return self.requester_content_type_id is None and self.guest_token is not None
 
     @property
     def requester_name(self):
@@ -460,7 +584,7 @@ class Ticket(models.Model):
         if self.is_guest:
             return self.guest_name or "Guest"
         try:
-            user = self.requester
+            user = self.get_requester()
             if user:
                 name = getattr(user, "get_full_name", lambda: str(user))()
                 return name or str(user)
@@ -474,7 +598,7 @@ class Ticket(models.Model):
         if self.is_guest:
             return self.guest_email or ""
         try:
-            user = self.requester
+            user = self.get_requester()
             if user:
                 return getattr(user, "email", "")
         except Exception:
@@ -483,11 +607,15 @@ class Ticket(models.Model):
 
     def is_followed_by(self, user_id):
         """Check if a user is following this ticket."""
+        if "ticket_followers" in getattr(self, "_prefetched_objects_cache", {}):
+            return any(f.user_id == user_id for f in self.ticket_followers.all())
         return self.ticket_followers.filter(user_id=user_id).exists()
 
     def follow(self, user_id):
         """Add a follower to this ticket (idempotent)."""
-        TicketFollower.objects.get_or_create(ticket=self, user_id=user_id)
+        # One INSERT that skips an existing (ticket, user) row, instead of
+        # get_or_create's SELECT plus savepointed INSERT.
+        TicketFollower.objects.bulk_create([TicketFollower(ticket=self, user_id=user_id)], ignore_conflicts=True)
 
     def unfollow(self, user_id):
         """Remove a follower from this ticket."""
@@ -495,7 +623,7 @@ class Ticket(models.Model):
 
     @property
     def followers_count(self):
-        """Return the number of followers on this ticket."""
+        """Return the number of followers on this ticket (from the prefetch when loaded)."""
         return self.ticket_followers.count()
 
     def attach_subject(self, subject, role=None, position=None):
@@ -564,13 +692,13 @@ class Ticket(models.Model):
     @property
     def last_reply_at(self):
         """Return the timestamp of the latest reply, or None."""
-        last = self.replies.filter(is_deleted=False).order_by("-created_at").first()
+        last = self.replies.visible().order_by("-created_at").first()
         return last.created_at if last else None
 
     @property
     def last_reply_author(self):
         """Return the name of the latest reply's author, or None."""
-        last = self.replies.filter(is_deleted=False).order_by("-created_at").first()
+        last = self.replies.visible().order_by("-created_at").first()
         if last is None:
             return None
         author = last.author
@@ -579,6 +707,24 @@ class Ticket(models.Model):
         name = getattr(author, "get_full_name", lambda: str(author))()
         return name or str(author)
 
+    def set_status(self, new_status):
+        """
+        Move the ticket to ``new_status``, stamping lifecycle timestamps.
+
+        Only the status columns are written, so the description and
+        metadata payloads aren't rewritten for a status flip.
+        """
+        now = timezone.now()
+        self.status = new_status
+        if new_status == self.Status.RESOLVED:
+            self.resolved_at = now
+        elif new_status == self.Status.CLOSED:
+            self.closed_at = now
+        elif new_status == self.Status.REOPENED:
+            self.resolved_at = None
+            self.closed_at = None
+        self.save(update_fields=["status", "resolved_at", "closed_at", "updated_at"])
+
     @property
     def is_snoozed(self):
         """Check if the ticket is currently snoozed."""
@@ -648,7 +794,8 @@ class Reply(models.Model):
         NOTE = "note", _("Internal Note")
         SYSTEM = "system", _("System")
 
-    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="replies")
+    # Indexed by esc_reply_tc_idx below, which leads with ticket.
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="replies", db_index=False)
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -672,9 +819,16 @@ class Reply(models.Model):
         object_id_field="object_id",
     )
 
+    objects = ReplyManager()
+
     class Meta:
         db_table = get_table_name("replies")
         ordering = ["created_at"]
+        indexes = [
+            # Ticket pages load replies in thread order; this also serves the
+            # is_deleted=False filter, as soft-deleted rows are rare.
+            models.Index(fields=["ticket", "created_at"], name="esc_reply_tc_idx"),
+        ]
 
     def __str__(self):
         return f"Reply on {self.ticket.reference} by {self.author}"
@@ -696,13 +850,16 @@ class Attachment(models.Model):
     file = models.FileField(upload_to="escalated/attachments/%Y/%m/")
     original_filename = models.CharField(max_length=500)
     mime_type = models.CharField(max_length=255, blank=True, default="")
-    size = models.PositiveIntegerField(default=0, help_text=_("File size in bytes"))
+    size = models.PositiveBigIntegerField(default=0, help_text=_("File size in bytes"))
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = get_table_name("attachments")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["content_type", "object_id"], name="esc_att_parent_idx"),
+        ]
 
     def __str__(self):
         return self.original_filename
@@ -796,6 +953,15 @@ class TicketActivity(models.Model):
     )
     causer_object_id = models.CharField(max_length=255, null=True, blank=True)
     causer = GenericForeignKey("causer_content_type", "causer_object_id")
+    # Mirror of ``causer`` when it is the host user model; see Ticket.requester_user.
+    causer_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
 
     type = models.CharField(max_length=30, choices=ActivityType.choices)
     properties = models.JSONField(default=dict)
@@ -809,10 +975,60 @@ class TicketActivity(models.Model):
     def __str__(self):
         return f"{self.type} on {self.ticket.reference}"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        causer = (self.causer_content_type_id, self.causer_object_id)
+        if update_fields is None:
+            refresh = self._state.adding or causer != getattr(self, "_saved_causer", None)
+        else:
+            refresh = bool({"causer_content_type", "causer_object_id"} & set(update_fields))
+        if refresh:
+            self.causer_user_id = _user_pk_for(*causer, cached=TicketActivity.causer.get_cached_value(self, None))
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "causer_user"}
+        super().save(*args, **kwargs)
+        self._saved_causer = causer
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._saved_causer = (
+            instance.__dict__.get("causer_content_type_id"),
+            instance.__dict__.get("causer_object_id"),
+        )
+        return instance
+
+    @classmethod
+    def bulk_log(cls, activities, batch_size=500):
+        """
+        Insert unsaved activities with one multi-row INSERT per batch.
+
+        bulk_create() bypasses save(), so the causer_user mirror is filled
+        in here.
+        """
+        activities = list(activities)
+        candidates = [_user_pk_candidate(a.causer_content_type_id, a.causer_object_id) for a in activities]
+        wanted = {pk for pk in candidates if pk is not None}
+        existing = set(get_user_model()._default_manager.filter(pk__in=wanted).values_list("pk", flat=True))
+        for activity, pk in zip(activities, candidates):
+            activity.causer_user_id = pk if pk in existing else None
+        return cls.objects.bulk_create(activities, batch_size=batch_size)
+
+    def get_causer(self):
+        """Return the causer, preferring the concrete user FK over the generic relation."""
+        if self.causer_user_id is not None:
+            return self.causer_user
+        return self.causer
+
 
 class EscalatedSetting(models.Model):
     """Key-value settings store for Escalated configuration."""
 
+    # Reads go through Django's cache. Saves and deletes evict the key (see
+    # escalated.handlers); the timeout bounds staleness when each worker has
+    # its own local-memory cache.
+    CACHE_TIMEOUT = 300
+
     key = models.CharField(max_length=255, unique=True)
     value = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -824,13 +1040,27 @@ class EscalatedSetting(models.Model):
     def __str__(self):
         return f"{self.key} = {self.value}"
 
+    @staticmethod
+    def cache_key(key):
+        return f"escalated_setting:{key}"
+
     @classmethod
     def get(cls, key, default=None):
         """Get a setting value by key."""
-        try:
-            return cls.objects.get(key=key).value
-        except cls.DoesNotExist:
-            return default
+        cache_key = cls.cache_key(key)
+        # [] for a missing row, [value] otherwise, so misses are cached too.
+        cached = cache.get(cache_key)
+        if cached is None:
+            cached = list(cls.objects.filter(key=key).values_list("value", flat=True)[:1])
+            cache.set(cache_key, cached, cls.CACHE_TIMEOUT)
+        return cached[0] if cached else default
+
+    @classmethod
+    def forget(cls, key):
+        """Evict a cached setting now and again once the transaction commits."""
+        cache_key = cls.cache_key(key)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
 
     @classmethod
     def set(cls, key, value):
@@ -844,7 +1074,7 @@ class EscalatedSetting(models.Model):
         val = cls.get(key)
         if val is None:
             return default
-        return val in ("1", "true", "True", "yes")
+        return val.strip().lower() in _TRUE_VALUES
 
     @classmethod
     def get_int(cls, key, default=0):
@@ -895,15 +1125,20 @@ class Macro(models.Model):
 class TicketFollower(models.Model):
     """Join table tracking which users follow which tickets."""
 
+    # The (ticket, user) unique constraint below leads with ticket and
+    # serves ticket lookups, so the FK doesn't need its own index.
     ticket = models.ForeignKey(
         "Ticket",
         on_delete=models.CASCADE,
         related_name="ticket_followers",
+        db_index=False,
     )
+    # Indexed by esc_tf_user_ticket_idx below.
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="escalated_followed_tickets",
+        db_index=False,
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -916,6 +1151,11 @@ class TicketFollower(models.Model):
                 name="escalated_tf_ticket_user_uniq",
             ),
         ]
+        indexes = [
+            # "Following" ticket filters read only ticket_id for a user, which
+            # this index answers without touching the table.
+            models.Index(fields=["user", "ticket"], name="esc_tf_user_ticket_idx"),
+        ]
 
     def __str__(self):
         return f"User {self.user_id} follows Ticket {self.ticket_id}"
@@ -934,13 +1174,15 @@ class SatisfactionRating(models.Model):
     )
     comment = models.TextField(blank=True, null=True)
 
-    # GenericFK for the rater (authenticated user or null for guests)
+    # GenericFK for the rater (authenticated user or null for guests). Only
+    # read back from a rating, never filtered on, so it isn't indexed.
     rated_by_content_type = models.ForeignKey(
         ContentType,
         on_delete=models.CASCADE,
         null=True,
         blank=True,
         related_name="escalated_satisfaction_ratings",
+        db_index=False,
     )
     rated_by_object_id = models.CharField(max_length=255, null=True, blank=True)
     rated_by = GenericForeignKey("rated_by_content_type", "rated_by_object_id")
@@ -1000,9 +1242,8 @@ class InboundEmail(models.Model):
         db_table = get_table_name("inbound_emails")
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["status"]),
+            models.Index(fields=["status", "-created_at"], name="esc_ie_status_created_idx"),
             models.Index(fields=["from_email"]),
-            models.Index(fields=["message_id"]),
         ]
 
     def __str__(self):
@@ -1068,19 +1309,22 @@ class ApiTokenManager(models.Manager):
 class ApiToken(models.Model):
     """API token for authenticating REST API requests."""
 
-    # Tokenable via GenericForeignKey (like Laravel morphTo)
+    # Tokenable via GenericForeignKey (like Laravel morphTo). Owner lookups
+    # (deleting a user's tokens) use the composite index in Meta, which
+    # covers the content type on its own too.
     tokenable_content_type = models.ForeignKey(
         ContentType,
         on_delete=models.CASCADE,
         null=True,
         blank=True,
         related_name="escalated_api_tokens",
+        db_index=False,
     )
     tokenable_object_id = models.CharField(max_length=255, null=True, blank=True)
     tokenable = GenericForeignKey("tokenable_content_type", "tokenable_object_id")
 
     name = models.CharField(max_length=255)
-    token = models.CharField(max_length=64, unique=True, db_index=True)
+    token = models.CharField(max_length=64, unique=True)
     abilities = models.JSONField(default=list)
     last_used_at = models.DateTimeField(null=True, blank=True)
     last_used_ip = models.CharField(max_length=45, null=True, blank=True)
@@ -1093,6 +1337,9 @@ class ApiToken(models.Model):
     class Meta:
         db_table = get_table_name("api_tokens")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["tokenable_content_type", "tokenable_object_id"], name="esc_tok_owner_idx"),
+        ]
 
     def __str__(self):
         return f"ApiToken({self.name})"
@@ -10,7 +10,13 @@ def is_agent(user):
     """
     if not user or not user.is_authenticated:
         return False
-    return Department.objects.filter(agents=user, is_active=True).exists()
+    # A request runs several permission checks against the same user
+    # instance; remember the answer on it so they share one query.
+    cached = getattr(user, "_escalated_is_agent", None)
+    if cached is None:
+        cached = Department.objects.filter(agents=user, is_active=True).exists()
+        user._escalated_is_agent = cached
+    return cached
 
 
 def is_admin(user):
@@ -23,6 +29,11 @@ def is_admin(user):
     return user.is_staff or user.is_superuser
 
 
+def _is_requester(user, ticket):
+    ct = ContentType.objects.get_for_model(user)
+    return ticket.requester_content_type_id == ct.pk and str(ticket.requester_object_id) == str(user.pk)
+
+
 def can_view_ticket(user, ticket):
     """
     Check if a user can view a ticket. Users can view if they are:
@@ -38,20 +49,21 @@ def can_view_ticket(user, ticket):
         return True
 
     # Check if user is the requester
-    ct = ContentType.objects.get_for_model(user)
-    if ticket.requester_content_type == ct and str(ticket.requester_object_id) == str(user.pk):
+    if _is_requester(user, ticket):
         return True
 
     # Check if user is the assigned agent
-    if ticket.assigned_to == user:
+    if ticket.assigned_to_id == user.pk:
         return True
 
-    # Check if user is an agent in the ticket's department
-    if ticket.department and ticket.department.agents.filter(pk=user.pk).exists():
+    # Check if user is an agent in any department (can see all tickets).
+    # This is memoized per user, so it goes before the per-ticket check.
+    if is_agent(user):
         return True
 
-    # Check if user is an agent in any department (can see all tickets)
-    if is_agent(user):
+    # Still allow agents of the ticket's own department when that
+    # department has been deactivated.
+    if ticket.department_id and Department.objects.filter(pk=ticket.department_id, agents=user).exists():
         return True
 
     return False
@@ -68,7 +80,7 @@ def can_update_ticket(user, ticket):
     if is_admin(user):
         return True
 
-    if ticket.assigned_to == user:
+    if ticket.assigned_to_id == user.pk:
         return True
 
     if is_agent(user):
@@ -89,8 +101,7 @@ def can_reply_ticket(user, ticket):
         return True
 
     # Requester can reply
-    ct = ContentType.objects.get_for_model(user)
-    if ticket.requester_content_type == ct and str(ticket.requester_object_id) == str(user.pk):
+    if _is_requester(user, ticket):
         return True
 
     if is_agent(user):
@@ -123,8 +134,7 @@ def can_close_ticket(user, ticket):
     from escalated.conf import get_setting
 
     if get_setting("ALLOW_CUSTOMER_CLOSE"):
-        ct = ContentType.objects.get_for_model(user)
-        if ticket.requester_content_type == ct and str(ticket.requester_object_id) == str(user.pk):
+        if _is_requester(user, ticket):
             return True
 
     return False
@@ -22,6 +22,26 @@ from escalated.hooks import do_action
 
 logger = logging.getLogger("escalated.plugins")
 
+# Parsed plugin.json manifests keyed by path, with the mtime they were read at.
+# Services are built per request, so the cache lives at module level.
+_manifest_cache = {}
+
+
+def _read_manifest(manifest_path):
+    """
+    Parse the plugin.json at *manifest_path*, reusing the previous parse while
+    the file's mtime is unchanged. Raises ``OSError`` / ``json.JSONDecodeError``
+    like ``json.load``.
+    """
+    mtime = os.stat(manifest_path).st_mtime_ns
+    cached = _manifest_cache.get(manifest_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(manifest_path, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    _manifest_cache[manifest_path] = (mtime, manifest)
+    return manifest
+
 
 class PluginService:
     """
@@ -52,8 +72,7 @@ class PluginService:
         if not os.path.isfile(manifest_path):
             return None
         try:
-            with open(manifest_path, encoding="utf-8") as fh:
-                return json.load(fh)
+            return _read_manifest(manifest_path)
         except (json.JSONDecodeError, OSError) as exc:
             logger.warning("Failed to read manifest for plugin '%s': %s", slug, exc)
             return None
@@ -77,8 +96,7 @@ class PluginService:
         if not os.path.isfile(manifest_path):
             return None
         try:
-            with open(manifest_path, encoding="utf-8") as fh:
-                return json.load(fh)
+            return _read_manifest(manifest_path)
         except (json.JSONDecodeError, OSError) as exc:
             logger.warning("Failed to read manifest for plugin '%s': %s", slug, exc)
             return None
@@ -107,20 +125,25 @@ class PluginService:
 
         plugins = []
 
-        for entry in sorted(os.listdir(self._plugins_path)):
+        # scandir reports is_dir() from the directory listing itself, so no
+        # per-entry stat is needed.
+        with os.scandir(self._plugins_path) as it:
+            entries = sorted(e.name for e in it if e.is_dir())
+
+        # Merge DB state, fetched in one query for every directory.
+        try:
+            db_plugins = {p.slug: p for p in EscalatedPlugin.objects.filter(slug__in=entries)}
+        except Exception:
+            db_plugins = {}
+
+        for entry in entries:
             plugin_dir = os.path.join(self._plugins_path, entry)
-            if not os.path.isdir(plugin_dir):
-                continue
 
             manifest = self._get_manifest(entry)
             if manifest is None:
                 continue
 
-            # Merge DB state
-            try:
-                db_plugin = EscalatedPlugin.objects.filter(slug=entry).first()
-            except Exception:
-                db_plugin = None
+            db_plugin = db_plugins.get(entry)
 
             plugins.append(
                 {
@@ -149,7 +172,7 @@ class PluginService:
 
         from escalated.plugin_models import EscalatedPlugin
 
-        plugins = []
+        found = []
         try:
             for dist in importlib.metadata.distributions():
                 # Check if the distribution has a plugin.json at its root
@@ -170,42 +193,44 @@ class PluginService:
 
                 directory = os.path.dirname(dist_path)
                 try:
-                    with open(dist_path, encoding="utf-8") as fh:
-                        manifest = json.load(fh)
+                    manifest = _read_manifest(dist_path)
                 except (json.JSONDecodeError, OSError):
                     continue
 
                 if not manifest:
                     continue
 
-                slug = dist.metadata["Name"]
-
-                try:
-                    db_plugin = EscalatedPlugin.objects.filter(slug=slug).first()
-                except Exception:
-                    db_plugin = None
-
-                plugins.append(
-                    {
-                        "slug": slug,
-                        "name": manifest.get("name", slug),
-                        "description": manifest.get("description", ""),
-                        "version": manifest.get("version", "1.0.0"),
-                        "author": manifest.get("author", "Unknown"),
-                        "author_url": manifest.get("author_url", ""),
-                        "requires": manifest.get("requires", "1.0.0"),
-                        "main_file": manifest.get("main_file", "plugin.py"),
-                        "is_active": db_plugin.is_active if db_plugin else False,
-                        "activated_at": (
-                            db_plugin.activated_at.isoformat() if db_plugin and db_plugin.activated_at else None
-                        ),
-                        "path": directory,
-                        "source": "composer",  # Use "composer" for consistency with frontend
-                    }
-                )
+                found.append((dist.metadata["Name"], manifest, directory))
         except Exception as exc:
             logger.debug("Could not scan pip packages: %s", exc)
 
+        try:
+            db_plugins = {p.slug: p for p in EscalatedPlugin.objects.filter(slug__in=[f[0] for f in found])}
+        except Exception:
+            db_plugins = {}
+
+        plugins = []
+        for slug, manifest, directory in found:
+            db_plugin = db_plugins.get(slug)
+            plugins.append(
+                {
+                    "slug": slug,
+                    "name": manifest.get("name", slug),
+                    "description": manifest.get("description", ""),
+                    "version": manifest.get("version", "1.0.0"),
+                    "author": manifest.get("author", "Unknown"),
+                    "author_url": manifest.get("author_url", ""),
+                    "requires": manifest.get("requires", "1.0.0"),
+                    "main_file": manifest.get("main_file", "plugin.py"),
+                    "is_active": db_plugin.is_active if db_plugin else False,
+                    "activated_at": (
+                        db_plugin.activated_at.isoformat() if db_plugin and db_plugin.activated_at else None
+                    ),
+                    "path": directory,
+                    "source": "composer",  # Use "composer" for consistency with frontend
+                }
+            )
+
         return plugins
 
     def get_activated_plugins(self):
@@ -339,6 +364,7 @@ class PluginService:
             plugin.delete()
 
         # Remove plugin directory
+        _manifest_cache.pop(os.path.join(plugin_path, "plugin.json"), None)
         try:
             shutil.rmtree(plugin_path)
         except OSError as exc:
@@ -395,8 +421,7 @@ class PluginService:
             from escalated.plugin_models import EscalatedPlugin
 
             try:
-                with open(manifest_path, encoding="utf-8") as fh:
-                    manifest = json.load(fh)
+                manifest = _read_manifest(manifest_path)
             except (json.JSONDecodeError, OSError):
                 manifest = {}
 
@@ -464,8 +489,7 @@ class PluginService:
 
         manifest_path = os.path.join(plugin_dir, "plugin.json")
         try:
-            with open(manifest_path, encoding="utf-8") as fh:
-                manifest = json.load(fh)
+            manifest = _read_manifest(manifest_path)
         except (json.JSONDecodeError, OSError):
             logger.warning("Cannot load plugin '%s': no manifest found.", slug)
             return
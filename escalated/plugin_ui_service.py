@@ -42,6 +42,7 @@ class PluginUIService:
 
     def __init__(self):
         self._menu_items = []
+        self._menu_by_label = {}  # {label: first menu item registered with it}
         self._dashboard_widgets = []
         self._custom_pages = {}  # {route: page_config}
         self._page_components = {}  # {page: {slot: [component, ...]}}
@@ -78,7 +79,10 @@ class PluginUIService:
             }
         """
         merged = {**self._MENU_DEFAULTS, **item}
+        # Copy so submenus added later don't land in the shared default list.
+        merged["submenu"] = list(merged["submenu"] or [])
         self._menu_items.append(merged)
+        self._menu_by_label.setdefault(merged["label"], merged)
 
     def add_menu_items(self, items):
         """Register multiple menu items at once."""
@@ -99,12 +103,9 @@ class PluginUIService:
         }
         merged = {**defaults, **submenu_item}
 
-        for menu_item in self._menu_items:
-            if menu_item["label"] == parent_label:
-                if not isinstance(menu_item.get("submenu"), list):
-                    menu_item["submenu"] = []
-                menu_item["submenu"].append(merged)
-                break
+        menu_item = self._menu_by_label.get(parent_label)
+        if menu_item is not None:
+            menu_item["submenu"].append(merged)
 
     def get_menu_items(self, target=None):
         """
@@ -242,6 +243,7 @@ class PluginUIService:
     def clear(self):
         """Remove all registered UI elements. Useful for testing."""
         self._menu_items.clear()
+        self._menu_by_label.clear()
         self._dashboard_widgets.clear()
         self._custom_pages.clear()
         self._page_components.clear()
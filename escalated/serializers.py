@@ -85,13 +85,13 @@ class TicketSerializer:
 
         # Include requester info
         try:
-            requester = ticket.requester
+            requester = ticket.get_requester()
             data["requester"] = _user_dict(requester) if requester else None
         except Exception:
             data["requester"] = None
 
         if include_replies:
-            data["replies"] = [ReplySerializer.serialize(reply) for reply in ticket.replies.filter(is_deleted=False)]
+            data["replies"] = [ReplySerializer.serialize(reply) for reply in ticket.replies.visible()]
 
         if include_activities:
             data["activities"] = [ActivitySerializer.serialize(activity) for activity in ticket.activities.all()[:50]]
@@ -302,7 +302,7 @@ class ActivitySerializer:
             "created_at_human": _human_dt(activity.created_at),
         }
         try:
-            causer = activity.causer
+            causer = activity.get_causer()
             data["causer"] = _user_dict(causer) if causer else None
         except Exception:
             data["causer"] = None
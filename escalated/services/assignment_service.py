@@ -32,16 +32,7 @@ class AssignmentService:
             agents.annotate(
                 open_ticket_count=Count(
                     "escalated_assigned_tickets",
-                    filter=Q(
-                        escalated_assigned_tickets__status__in=[
-                            Ticket.Status.OPEN,
-                            Ticket.Status.IN_PROGRESS,
-                            Ticket.Status.WAITING_ON_CUSTOMER,
-                            Ticket.Status.WAITING_ON_AGENT,
-                            Ticket.Status.ESCALATED,
-                            Ticket.Status.REOPENED,
-                        ]
-                    ),
+                    filter=Q(escalated_assigned_tickets__status__in=Ticket.OPEN_STATUSES),
                 )
             )
             .order_by("open_ticket_count")
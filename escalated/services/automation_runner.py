@@ -28,9 +28,7 @@ class AutomationRunner:
 
         from escalated.models import Ticket
 
-        query = Ticket.objects.filter(
-            status__in=["open", "in_progress", "waiting_on_customer", "waiting_on_agent", "escalated", "reopened"]
-        )
+        query = Ticket.objects.open()
 
         for condition in automation.conditions or []:
             field = condition.get("field", "")
@@ -76,7 +74,9 @@ class AutomationRunner:
             try:
                 if action_type == "change_status":
                     ticket.status = value
-                    ticket.save(update_fields=["status", "updated_at"])
+                    if value == Ticket.Status.RESOLVED and not ticket.resolved_at:
+                        ticket.resolved_at = timezone.now()
+                    ticket.save(update_fields=["status", "resolved_at", "updated_at"])
                 elif action_type == "assign":
                     ticket.assigned_to_id = int(value)
                     ticket.save(update_fields=["assigned_to_id", "updated_at"])
@@ -23,15 +23,20 @@ class EscalationService:
         Evaluate all active escalation rules against all open tickets.
         Called by the evaluate_escalations management command.
         """
-        rules = EscalationRule.objects.filter(is_active=True).order_by("order")
-        open_tickets = Ticket.objects.open().select_related("assigned_to", "department", "sla_policy")
+        rules = list(EscalationRule.objects.filter(is_active=True).order_by("order"))
+        if not rules:
+            return 0
+        open_tickets = Ticket.objects.open().select_related("assigned_to", "department", "sla_policy").without_bodies()
 
+        # Rules are few and tickets many: hold the rules and walk the
+        # tickets once in fetched chunks, applying the rules to each in order.
         actions_taken = 0
-        for rule in rules:
-            for ticket in open_tickets:
-                if EscalationService._matches_conditions(ticket, rule):
-                    if EscalationService._execute_actions(ticket, rule):
-                        actions_taken += 1
+        for chunk in open_tickets.in_pk_chunks():
+            for ticket in chunk:
+                for rule in rules:
+                    if EscalationService._matches_conditions(ticket, rule):
+                        if EscalationService._execute_actions(ticket, rule):
+                            actions_taken += 1
 
         return actions_taken
 
@@ -112,7 +117,7 @@ class EscalationService:
         Returns True if any action was taken.
         """
         actions = rule.actions or {}
-        acted = False
+        changed = []
 
         # Change priority
         if "set_priority" in actions:
@@ -120,7 +125,7 @@ class EscalationService:
             if ticket.priority != new_priority:
                 old_priority = ticket.priority
                 ticket.priority = new_priority
-                acted = True
+                changed.append("priority")
                 logger.info(
                     f"Escalation rule '{rule.name}' changed priority on "
                     f"{ticket.reference}: {old_priority} -> {new_priority}"
@@ -130,7 +135,7 @@ class EscalationService:
         if actions.get("escalate", False):
             if ticket.status != Ticket.Status.ESCALATED:
                 ticket.status = Ticket.Status.ESCALATED
-                acted = True
+                changed.append("status")
                 ticket_escalated.send(
                     sender=Ticket,
                     ticket=ticket,
@@ -144,7 +149,7 @@ class EscalationService:
                 agent = User.objects.get(pk=actions["assign_to_id"])
                 if ticket.assigned_to != agent:
                     ticket.assigned_to = agent
-                    acted = True
+                    changed.append("assigned_to")
                     logger.info(f"Escalation rule '{rule.name}' assigned {ticket.reference} to {agent}")
             except User.DoesNotExist:
                 logger.warning(f"Escalation rule '{rule.name}' references non-existent user {actions['assign_to_id']}")
@@ -157,14 +162,14 @@ class EscalationService:
                 dept = Department.objects.get(pk=actions["department_id"])
                 if ticket.department != dept:
                     ticket.department = dept
-                    acted = True
+                    changed.append("department")
             except Department.DoesNotExist:
                 logger.warning(
                     f"Escalation rule '{rule.name}' references non-existent department {actions['department_id']}"
                 )
 
-        if acted:
-            ticket.save()
+        if changed:
+            ticket.save(update_fields=[*changed, "updated_at"])
             TicketActivity.objects.create(
                 ticket=ticket,
                 type=TicketActivity.ActivityType.ESCALATED,
@@ -175,4 +180,4 @@ class EscalationService:
                 },
             )
 
-        return acted
+        return bool(changed)
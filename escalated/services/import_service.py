@@ -313,7 +313,10 @@ class ImportService:
             department_id=department_id,
             requester_id=requester_id,
             metadata=record.get("metadata"),
+            resolved_at=record.get("resolved_at"),
         )
+        if ticket.status == Ticket.Status.RESOLVED and not ticket.resolved_at:
+            ticket.resolved_at = record.get("updated_at") or record.get("created_at") or timezone.now()
 
         # Preserve original timestamps
         if record.get("created_at"):
@@ -2,8 +2,10 @@ import logging
 import os
 import re
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 
 from escalated.conf import get_setting
 from escalated.mail.inbound_message import InboundMessage
@@ -219,6 +221,44 @@ class InboundEmailService:
 
         return inbound
 
+    @staticmethod
+    def poll_imap(adapter, workers: int = 1) -> tuple[int, int]:
+        """
+        Run one IMAP poll cycle: fetch new messages and process each one.
+
+        Shared by the poll_imap management command and Celery task.
+
+        Args:
+            adapter: An IMAPAdapter (or anything with fetch_messages()).
+            workers: Messages to process concurrently; 1 is sequential.
+
+        Returns:
+            (processed, failed) counts for this cycle.
+
+        Raises:
+            ConnectionError: If the mailbox cannot be reached.
+        """
+        messages = adapter.fetch_messages()
+
+        if workers > 1 and len(messages) > 1:
+            # Each message is independent I/O (attachments, notifications,
+            # DB writes), so overlap them.
+            with ThreadPoolExecutor(max_workers=min(workers, len(messages))) as pool:
+                results = list(pool.map(InboundEmailService._process_in_thread, messages))
+        else:
+            results = [InboundEmailService.process(message, adapter_name="imap") for message in messages]
+
+        processed = sum(1 for inbound in results if inbound.status == InboundEmail.Status.PROCESSED)
+        return processed, len(results) - processed
+
+    @staticmethod
+    def _process_in_thread(message: InboundMessage) -> InboundEmail:
+        """Process one message on a worker thread, releasing its DB connection afterwards."""
+        try:
+            return InboundEmailService.process(message, adapter_name="imap")
+        finally:
+            connection.close()
+
     @staticmethod
     def _process_message(message: InboundMessage, inbound: InboundEmail):
         """
@@ -0,0 +1,91 @@
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from escalated.conf import get_setting
+from escalated.models import Ticket, TicketActivity
+
+logger = logging.getLogger("escalated")
+
+RESOLVED = Ticket.Status.RESOLVED
+CLOSED = Ticket.Status.CLOSED
+
+
+class MaintenanceService:
+    """
+    Periodic housekeeping jobs.
+
+    The management commands and the optional Celery tasks in
+    ``escalated.tasks`` both call into this service, so a long-running
+    worker can run the same jobs without booting a fresh ``manage.py``
+    process each time.
+    """
+
+    @staticmethod
+    def stale_resolved_tickets(days=None):
+        """Return tickets resolved more than ``days`` ago that are still open to auto-close."""
+        days = days or get_setting("AUTO_CLOSE_RESOLVED_AFTER_DAYS")
+        threshold = timezone.now() - timedelta(days=days)
+        return Ticket.objects.filter(
+            status=RESOLVED,
+            resolved_at__isnull=False,
+            resolved_at__lt=threshold,
+        )
+
+    @staticmethod
+    def close_resolved_tickets(days=None, batch_size=5000):
+        """
+        Close tickets that have been resolved for more than ``days``.
+
+        Updates are issued in primary-key batches so a large backlog never
+        turns into one long-running UPDATE holding row locks on the whole set.
+
+        Returns the number of tickets closed.
+        """
+        batch_size = max(1, batch_size)
+        now = timezone.now()
+        updated = 0
+        pks = MaintenanceService.stale_resolved_tickets(days).order_by().values_list("pk", flat=True)
+        while True:
+            batch = list(pks[:batch_size])
+            if not batch:
+                break
+            # QuerySet.update() bypasses auto_now, so stamp updated_at here.
+            updated += Ticket.objects.filter(pk__in=batch, status=RESOLVED).update(
+                status=CLOSED,
+                closed_at=now,
+                updated_at=now,
+            )
+            if len(batch) < batch_size:
+                break
+        return updated
+
+    @staticmethod
+    def old_activities(days=90):
+        """Return ticket activities older than ``days``."""
+        threshold = timezone.now() - timedelta(days=days)
+        return TicketActivity.objects.filter(created_at__lt=threshold)
+
+    @staticmethod
+    def purge_activities(days=90, batch_size=5000):
+        """
+        Delete ticket activities older than ``days``.
+
+        Like ``close_resolved_tickets``, rows go in primary-key batches so a
+        large retention backlog doesn't become one huge DELETE.
+
+        Returns the number of rows deleted.
+        """
+        batch_size = max(1, batch_size)
+        deleted = 0
+        pks = MaintenanceService.old_activities(days).order_by().values_list("pk", flat=True)
+        while True:
+            batch = list(pks[:batch_size])
+            if not batch:
+                break
+            count, _ = TicketActivity.objects.filter(pk__in=batch).delete()
+            deleted += count
+            if len(batch) < batch_size:
+                break
+        return deleted
@@ -143,16 +143,21 @@ class SlaService:
         Check SLA breaches and warnings for all open tickets.
         Called by the check_sla management command.
         """
-        open_tickets = Ticket.objects.open().filter(sla_policy__isnull=False).select_related("sla_policy")
+        open_tickets = (
+            Ticket.objects.open().filter(sla_policy__isnull=False).select_related("sla_policy").without_bodies()
+        )
 
         breached_count = 0
         warned_count = 0
 
-        for ticket in open_tickets:
-            if SlaService.check_breach(ticket):
-                breached_count += 1
-            if SlaService.check_warning(ticket):
-                warned_count += 1
+        # Single pass, so work through bounded chunks instead of caching
+        # every ticket; each chunk is fetched before any ticket is saved.
+        for chunk in open_tickets.in_pk_chunks():
+            for ticket in chunk:
+                if SlaService.check_breach(ticket):
+                    breached_count += 1
+                if SlaService.check_warning(ticket):
+                    warned_count += 1
 
         return breached_count, warned_count
 
@@ -51,4 +51,4 @@ class TicketMergeService:
             # Close source and set merged_into
             source.status = Ticket.Status.CLOSED
             source.merged_into = target
-            source.save()
+            source.save(update_fields=["status", "merged_into", "updated_at"])
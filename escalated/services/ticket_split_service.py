@@ -93,7 +93,7 @@ class TicketSplitService:
                 },
             )
 
-            # Activity on source
+            # Causer for both split activities
             causer_ct = None
             causer_oid = None
             if split_by_user_id:
@@ -103,27 +103,30 @@ class TicketSplitService:
                 causer_ct = ContentType.objects.get_for_model(User)
                 causer_oid = split_by_user_id
 
-            TicketActivity.objects.create(
-                ticket=source,
-                causer_content_type=causer_ct,
-                causer_object_id=causer_oid,
-                type=TicketActivity.ActivityType.CREATED,
-                properties={
-                    "action": "split",
-                    "new_ticket_reference": new_ticket.reference,
-                },
-            )
-
-            # Activity on new ticket
-            TicketActivity.objects.create(
-                ticket=new_ticket,
-                causer_content_type=causer_ct,
-                causer_object_id=causer_oid,
-                type=TicketActivity.ActivityType.CREATED,
-                properties={
-                    "action": "split_from",
-                    "source_ticket_reference": source.reference,
-                },
+            # Activities on the source and the new ticket, in one INSERT
+            TicketActivity.bulk_log(
+                [
+                    TicketActivity(
+                        ticket=source,
+                        causer_content_type=causer_ct,
+                        causer_object_id=causer_oid,
+                        type=TicketActivity.ActivityType.CREATED,
+                        properties={
+                            "action": "split",
+                            "new_ticket_reference": new_ticket.reference,
+                        },
+                    ),
+                    TicketActivity(
+                        ticket=new_ticket,
+                        causer_content_type=causer_ct,
+                        causer_object_id=causer_oid,
+                        type=TicketActivity.ActivityType.CREATED,
+                        properties={
+                            "action": "split_from",
+                            "source_ticket_reference": source.reference,
+                        },
+                    ),
+                ]
             )
 
             return new_ticket
@@ -163,14 +163,13 @@ class WorkflowEngine:
 
         try:
             if action_type == "change_status":
-                ticket.status = value
-                ticket.save()
+                ticket.set_status(value)
             elif action_type == "assign_agent":
                 ticket.assigned_to_id = int(value)
-                ticket.save()
+                ticket.save(update_fields=["assigned_to_id", "updated_at"])
             elif action_type == "change_priority":
                 ticket.priority = value
-                ticket.save()
+                ticket.save(update_fields=["priority", "updated_at"])
             elif action_type == "add_tag":
                 tag, _ = Tag.objects.get_or_create(name=value)
                 ticket.tags.add(tag)
@@ -180,7 +179,7 @@ class WorkflowEngine:
                     ticket.tags.remove(tag)
             elif action_type == "set_department":
                 ticket.department_id = int(value)
-                ticket.save()
+                ticket.save(update_fields=["department_id", "updated_at"])
             elif action_type == "add_note":
                 Reply.objects.create(
                     ticket=ticket,
@@ -191,7 +190,7 @@ class WorkflowEngine:
                 self._send_webhook(action, ticket)
             elif action_type == "set_type":
                 ticket.ticket_type = value
-                ticket.save()
+                ticket.save(update_fields=["ticket_type", "updated_at"])
             elif action_type == "delay":
                 self._handle_delay(action, ticket, workflow)
                 return "delayed"
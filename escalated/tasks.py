@@ -0,0 +1,96 @@
+"""
+Celery tasks for Escalated's periodic jobs.
+
+Each task calls the same service function as the matching management
+command, so a long-running worker can run the schedule without paying
+interpreter start-up, settings import and connection setup on every tick.
+The commands stay available for running jobs by hand or from cron.
+
+Celery is optional. The task bodies are plain functions; only when Celery
+is installed are they wrapped with ``shared_task`` and registered.
+Example beat schedule::
+
+    from celery.schedules import crontab
+
+    CELERY_BEAT_SCHEDULE = {
+        "escalated-check-sla": {"task": "escalated.tasks.check_sla", "schedule": 60.0},
+        "escalated-evaluate-escalations": {"task": "escalated.tasks.evaluate_escalations", "schedule": 300.0},
+        "escalated-poll-imap": {"task": "escalated.tasks.poll_imap", "schedule": 60.0},
+        "escalated-close-resolved": {
+            "task": "escalated.tasks.close_resolved",
+            "schedule": crontab(hour=3, minute=0),
+        },
+        "escalated-purge-activities": {
+            "task": "escalated.tasks.purge_activities",
+            "schedule": crontab(hour=4, minute=0),
+        },
+    }
+"""
+
+import logging
+
+try:
+    from celery import shared_task
+
+    HAS_CELERY = True
+except ImportError:
+    HAS_CELERY = False
+
+logger = logging.getLogger("escalated")
+
+# One IMAP session per worker process, reused across poll_imap runs.
+_imap_adapter = None
+
+
+def check_sla():
+    from escalated.services.sla_service import SlaService
+
+    breached, warned = SlaService.check_all_tickets()
+    return {"breached": breached, "warned": warned}
+
+
+def evaluate_escalations():
+    from escalated.services.escalation_service import EscalationService
+
+    return EscalationService.evaluate_all()
+
+
+def close_resolved(days=None, batch_size=5000):
+    from escalated.services.maintenance_service import MaintenanceService
+
+    return MaintenanceService.close_resolved_tickets(days, batch_size=batch_size)
+
+
+def purge_activities(days=90, batch_size=5000):
+    from escalated.services.maintenance_service import MaintenanceService
+
+    return MaintenanceService.purge_activities(days, batch_size=batch_size)
+
+
+def poll_imap():
+    global _imap_adapter
+
+    from escalated.conf import get_setting
+    from escalated.mail.adapters.imap import IMAPAdapter
+    from escalated.services.inbound_email_service import InboundEmailService
+
+    if not get_setting("INBOUND_EMAIL_ENABLED") or not get_setting("IMAP_HOST"):
+        return {"processed": 0, "failed": 0}
+
+    if _imap_adapter is None:
+        _imap_adapter = IMAPAdapter(persistent=True)
+
+    try:
+        processed, failed = InboundEmailService.poll_imap(_imap_adapter)
+    except ConnectionError as exc:
+        logger.error(f"IMAP connection failed: {exc}")
+        return {"processed": 0, "failed": 0}
+    return {"processed": processed, "failed": failed}
+
+
+if HAS_CELERY:
+    check_sla = shared_task(name="escalated.tasks.check_sla")(check_sla)
+    evaluate_escalations = shared_task(name="escalated.tasks.evaluate_escalations")(evaluate_escalations)
+    close_resolved = shared_task(name="escalated.tasks.close_resolved")(close_resolved)
+    purge_activities = shared_task(name="escalated.tasks.purge_activities")(purge_activities)
+    poll_imap = shared_task(name="escalated.tasks.poll_imap")(poll_imap)
@@ -204,7 +204,7 @@ def tickets_index(request):
     if check:
         return check
 
-    tickets = Ticket.objects.select_related("assigned_to", "department").prefetch_related("tags")
+    tickets = Ticket.objects.select_related("assigned_to", "department", "requester_user").prefetch_related("tags")
 
     # Apply filters
     status = request.GET.get("status")
@@ -295,20 +295,21 @@ def tickets_show(request, ticket_id):
 
     try:
         ticket = (
-            Ticket.objects.select_related("assigned_to", "department", "sla_policy")
+            Ticket.objects.select_related("assigned_to", "department", "sla_policy", "requester_user")
             .prefetch_related(
                 "tags",
                 "replies__author",
                 "replies__attachments",
-                "activities",
+                "activities__causer_user",
                 "attachments",
+                "ticket_followers",
             )
             .get(pk=ticket_id)
         )
     except Ticket.DoesNotExist:
         return HttpResponseNotFound(_("Ticket not found"))
 
-    replies = ticket.replies.filter(is_deleted=False).select_related("author")
+    replies = ticket.replies.visible().select_related("author")
     activities = ticket.activities.all()[:50]
 
     canned_responses = CannedResponse.objects.filter(Q(is_shared=True) | Q(created_by=request.user))
@@ -317,9 +318,7 @@ def tickets_show(request, ticket_id):
     macros = Macro.objects.filter(Q(is_shared=True) | Q(created_by=request.user)).order_by("order")
 
     # Pinned notes
-    pinned_notes = ticket.replies.filter(is_deleted=False, is_internal_note=True, is_pinned=True).select_related(
-        "author"
-    )
+    pinned_notes = ticket.replies.visible().filter(is_internal_note=True, is_pinned=True).select_related("author")
 
     # Satisfaction rating
     try:
@@ -93,7 +93,7 @@ def ticket_list(request):
     if check:
         return check
 
-    tickets = Ticket.objects.select_related("assigned_to", "department").prefetch_related("tags")
+    tickets = Ticket.objects.select_related("assigned_to", "department", "requester_user").prefetch_related("tags")
 
     # Apply filters
     status = request.GET.get("status")
@@ -187,13 +187,14 @@ def ticket_show(request, ticket_id):
 
     try:
         ticket = (
-            Ticket.objects.select_related("assigned_to", "department", "sla_policy")
+            Ticket.objects.select_related("assigned_to", "department", "sla_policy", "requester_user")
             .prefetch_related(
                 "tags",
                 "replies__author",
                 "replies__attachments",
-                "activities",
+                "activities__causer_user",
                 "attachments",
+                "ticket_followers",
                 "chat_sessions",
                 "links_as_parent__child_ticket",
                 "links_as_child__parent_ticket",
@@ -206,7 +207,7 @@ def ticket_show(request, ticket_id):
     if not can_view_ticket(request.user, ticket):
         return HttpResponseForbidden(_("You cannot view this ticket."))
 
-    replies = ticket.replies.filter(is_deleted=False).select_related("author")
+    replies = ticket.replies.visible().select_related("author")
     activities = ticket.activities.all()[:50]
 
     # Available agents for assignment
@@ -218,9 +219,7 @@ def ticket_show(request, ticket_id):
     macros = Macro.objects.filter(Q(is_shared=True) | Q(created_by=request.user)).order_by("order")
 
     # Pinned notes
-    pinned_notes = ticket.replies.filter(is_deleted=False, is_internal_note=True, is_pinned=True).select_related(
-        "author"
-    )
+    pinned_notes = ticket.replies.visible().filter(is_internal_note=True, is_pinned=True).select_related("author")
 
     # Satisfaction rating
     try:
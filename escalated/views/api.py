@@ -76,11 +76,13 @@ def _resolve_ticket(reference):
     Resolve a ticket by reference string or numeric ID.
     Returns (ticket, None) on success, or (None, JsonResponse) on failure.
     """
-    base_qs = Ticket.objects.select_related("assigned_to", "department", "sla_policy").prefetch_related(
+    base_qs = Ticket.objects.select_related(
+        "assigned_to", "department", "sla_policy", "requester_user"
+    ).prefetch_related(
         "tags",
         "replies__author",
         "replies__attachments",
-        "activities",
+        "activities__causer_user",
         "attachments",
         "chat_sessions",
         "links_as_parent__child_ticket",
@@ -233,7 +235,9 @@ def ticket_list(request):
     Query params: status, priority, department_id, assigned_to, unassigned,
                   search, sla_breached, following, sort_by, sort_dir, per_page, page
     """
-    tickets = Ticket.objects.select_related("assigned_to", "department").prefetch_related("tags")
+    # The collection serializer shows neither tags nor the ticket body, so
+    # skip the tags prefetch and leave the large text/JSON columns unloaded.
+    tickets = Ticket.objects.select_related("assigned_to", "department", "requester_user").without_bodies()
 
     # Filters
     status = request.GET.get("status")
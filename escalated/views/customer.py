@@ -141,7 +141,7 @@ def ticket_show(request, ticket_id):
         return HttpResponseForbidden(_("You cannot view this ticket."))
 
     # Filter out internal notes for customers
-    replies = ticket.replies.filter(is_deleted=False, is_internal_note=False)
+    replies = ticket.replies.visible().filter(is_internal_note=False)
 
     from escalated.serializers import AttachmentSerializer, ReplySerializer
 
@@ -136,7 +136,7 @@ def ticket_show(request, token):
         return HttpResponseNotFound(_("Ticket not found."))
 
     # Filter out internal notes for guest users
-    replies = ticket.replies.filter(is_deleted=False, is_internal_note=False)
+    replies = ticket.replies.visible().filter(is_internal_note=False)
 
     return render_page(
         request,
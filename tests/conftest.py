@@ -1,4 +1,7 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.backends.base.base import BaseDatabaseWrapper
 
 from tests.factories import (
     ApiTokenFactory,
@@ -24,6 +27,22 @@ from tests.factories import (
 )
 
 
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings):
+    # AppConfig.ready() queries the plugin table, opening a private ":memory:"
+    # connection before the test database exists. SQLite's close() keeps
+    # in-memory connections open, so the main thread would go on using it
+    # while worker threads see the empty shared test database. Drop it.
+    BaseDatabaseWrapper.close(connection)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # EscalatedSetting.get() caches values; a test's rollback doesn't evict them.
+    cache.clear()
+    yield
+
+
 @pytest.fixture
 def user(db):
     return UserFactory()
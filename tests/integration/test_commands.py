@@ -1,3 +1,4 @@
+import threading
 from datetime import timedelta
 from io import StringIO
 
@@ -6,7 +7,7 @@ from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.utils import timezone
 
-from tests.factories import ApiTokenFactory, UserFactory, WebhookFactory
+from tests.factories import ApiTokenFactory, TicketFactory, UserFactory, WebhookFactory
 
 
 @pytest.mark.django_db
@@ -92,6 +93,56 @@ class TestPurgeExpiredDataCommand:
         assert ApiToken.objects.filter(pk=fresh.pk).exists()
 
 
+@pytest.mark.django_db
+class TestCloseResolvedCommand:
+    def _resolved(self, days_ago):
+        from escalated.models import Ticket
+
+        return TicketFactory(
+            status=Ticket.Status.RESOLVED,
+            resolved_at=timezone.now() - timedelta(days=days_ago),
+        )
+
+    def test_closes_stale_resolved_tickets(self):
+        from escalated.models import Ticket
+
+        stale = self._resolved(10)
+        fresh = self._resolved(1)
+
+        out = StringIO()
+        call_command("close_resolved", "--days", "7", stdout=out)
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        assert stale.status == Ticket.Status.CLOSED
+        assert stale.closed_at is not None
+        assert stale.updated_at == stale.closed_at
+        assert fresh.status == Ticket.Status.RESOLVED
+
+    def test_closes_across_batches(self):
+        from escalated.models import Ticket
+
+        tickets = [self._resolved(10) for _ in range(5)]
+
+        out = StringIO()
+        call_command("close_resolved", "--days", "7", "--batch-size", "2", stdout=out)
+
+        assert Ticket.objects.filter(pk__in=[t.pk for t in tickets], status=Ticket.Status.CLOSED).count() == 5
+        assert "5" in out.getvalue()
+
+    def test_dry_run_changes_nothing(self):
+        from escalated.models import Ticket
+
+        stale = self._resolved(10)
+
+        out = StringIO()
+        call_command("close_resolved", "--days", "7", "--dry-run", stdout=out)
+
+        stale.refresh_from_db()
+        assert stale.status == Ticket.Status.RESOLVED
+        assert stale.reference in out.getvalue()
+
+
 @pytest.mark.django_db
 class TestPluginCommand:
     def test_list_empty(self):
@@ -120,3 +171,79 @@ class TestPluginCommand:
         call_command("plugin", "deactivate", "test-plugin", stdout=out)
         plugin = EscalatedPlugin.objects.get(slug="test-plugin")
         assert plugin.is_active is False
+
+
+@pytest.mark.django_db
+class TestPurgeActivitiesCommand:
+    def test_purges_old_activities_across_batches(self):
+        from escalated.models import TicketActivity
+
+        ticket = TicketFactory()
+        TicketActivity.objects.filter(ticket=ticket).delete()
+        for _ in range(5):
+            TicketActivity.objects.create(ticket=ticket, type=TicketActivity.ActivityType.STATUS_CHANGED)
+        TicketActivity.objects.update(created_at=timezone.now() - timedelta(days=120))
+        recent = TicketActivity.objects.create(ticket=ticket, type=TicketActivity.ActivityType.REPLY_ADDED)
+
+        out = StringIO()
+        call_command("purge_activities", "--days", "90", "--batch-size", "2", stdout=out)
+
+        assert list(TicketActivity.objects.filter(ticket=ticket)) == [recent]
+        assert "Purged 5" in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPollImapCommand:
+    class _StubAdapter:
+        def __init__(self, messages):
+            self.messages = messages
+
+        def fetch_messages(self):
+            return self.messages
+
+    def test_workers_process_every_message_and_count_failures(self, monkeypatch):
+        from escalated.mail.inbound_message import InboundMessage
+        from escalated.management.commands.poll_imap import Command
+        from escalated.models import InboundEmail
+        from escalated.services.inbound_email_service import InboundEmailService
+
+        process = InboundEmailService.process
+        process_message = InboundEmailService._process_message
+        # The shared in-memory test database has no busy timeout, so let one
+        # worker write at a time; the pool and per-thread cleanup still run.
+        db_lock = threading.Lock()
+        threads = set()
+
+        def serialized(message, adapter_name="unknown"):
+            threads.add(threading.get_ident())
+            with db_lock:
+                return process(message, adapter_name=adapter_name)
+
+        def flaky(message, inbound):
+            if message.subject == "Broken":
+                raise ValueError("unparseable")
+            return process_message(message, inbound)
+
+        monkeypatch.setattr(InboundEmailService, "process", staticmethod(serialized))
+        monkeypatch.setattr(InboundEmailService, "_process_message", staticmethod(flaky))
+        messages = [
+            InboundMessage(
+                from_email=f"sender{n}@example.com",
+                from_name=None,
+                to_email="support@example.com",
+                subject="Broken" if n == 2 else f"Question {n}",
+                body_text="Hello",
+                body_html=None,
+                message_id=f"<poll-{n}@example.com>",
+            )
+            for n in range(4)
+        ]
+
+        out = StringIO()
+        command = Command(stdout=out)
+        command._poll_once(self._StubAdapter(messages), workers=2)
+
+        assert InboundEmail.objects.filter(status=InboundEmail.Status.PROCESSED).count() == 3
+        assert InboundEmail.objects.get(status=InboundEmail.Status.FAILED).subject == "Broken"
+        assert "3 processed, 1 failed" in out.getvalue()
+        assert threading.get_ident() not in threads
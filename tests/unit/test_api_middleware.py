@@ -132,8 +132,9 @@ class TestAuthenticateApiToken:
         user = UserFactory(username="deleted_owner")
         result = ApiToken.create_token(user, "Orphan")
 
-        # Delete the user — the token remains in DB
-        user.delete()
+        # Point the token at a user that no longer exists. (Deleting the
+        # user through the ORM revokes its tokens outright.)
+        ApiToken.objects.filter(pk=result["token"].pk).update(tokenable_object_id=str(user.pk + 1000))
 
         auth, _ = _make_middleware_pair()
         request = rf.get(
@@ -143,3 +143,12 @@ class TestApiTokenModel:
         result = ApiToken.create_token(user, "My Token Name")
 
         assert "My Token Name" in str(result["token"])
+
+    def test_deleting_user_revokes_tokens(self):
+        user = UserFactory(username="deleted_user")
+        ApiToken.create_token(user, "Doomed")
+        other = ApiToken.create_token(UserFactory(username="kept_user"), "Kept")["token"]
+
+        user.delete()
+
+        assert list(ApiToken.objects.all()) == [other]
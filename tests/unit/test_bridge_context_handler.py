@@ -0,0 +1,26 @@
+import pytest
+
+from escalated.bridge.context_handler import ContextHandler
+from escalated.models import Ticket
+from tests.factories import TicketFactory
+
+
+@pytest.mark.django_db
+class TestContextHandlerTickets:
+    def test_update_to_resolved_stamps_resolved_at(self):
+        ticket = TicketFactory()
+
+        ContextHandler().handle("ctx.tickets.update", {"id": ticket.pk, "data": {"status": "resolved"}})
+
+        ticket.refresh_from_db()
+        assert ticket.status == Ticket.Status.RESOLVED
+        assert ticket.resolved_at is not None
+
+    def test_create_resolved_ticket_stamps_resolved_at(self):
+        result = ContextHandler().handle(
+            "ctx.tickets.create",
+            {"data": {"subject": "Imported", "description": "From a plugin", "status": "resolved"}},
+        )
+
+        ticket = Ticket.objects.get(pk=result["id"])
+        assert ticket.resolved_at is not None
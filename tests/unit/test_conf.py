@@ -0,0 +1,17 @@
+from django.test import override_settings
+
+from escalated.conf import get_table_name, get_table_names
+
+
+def test_table_name_uses_default_prefix():
+    assert get_table_name("tickets") == "escalated_tickets"
+
+
+def test_table_prefix_follows_settings_override():
+    with override_settings(ESCALATED={"TABLE_PREFIX": "helpdesk_"}):
+        assert get_table_name("tickets") == "helpdesk_tickets"
+        assert get_table_names("tickets", "replies") == {
+            "tickets": "helpdesk_tickets",
+            "replies": "helpdesk_replies",
+        }
+    assert get_table_name("tickets") == "escalated_tickets"
@@ -0,0 +1,103 @@
+"""
+Connection-lifecycle tests for escalated.mail.adapters.imap.IMAPAdapter.
+The IMAP server is replaced by a MagicMock so no network is touched.
+"""
+
+import imaplib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from escalated.mail.adapters.imap import IMAPAdapter
+
+
+def _fake_conn():
+    conn = MagicMock()
+    conn.select.return_value = ("OK", [b"1"])
+    conn.search.return_value = ("OK", [b""])
+    conn.noop.return_value = ("OK", [b"NOOP completed"])
+    return conn
+
+
+def test_non_persistent_adapter_logs_out_after_fetch():
+    conn = _fake_conn()
+    adapter = IMAPAdapter()
+    with patch.object(adapter, "connect", return_value=conn) as connect:
+        adapter.fetch_messages()
+        adapter.fetch_messages()
+
+    assert connect.call_count == 2
+    assert conn.logout.call_count == 2
+
+
+def test_persistent_adapter_reuses_connection():
+    conn = _fake_conn()
+    adapter = IMAPAdapter(persistent=True)
+    with patch.object(adapter, "connect", return_value=conn) as connect:
+        adapter.fetch_messages()
+        adapter.fetch_messages()
+
+    assert connect.call_count == 1
+    conn.noop.assert_called_once()
+    conn.logout.assert_not_called()
+
+    adapter.disconnect()
+    conn.logout.assert_called_once()
+
+
+def test_persistent_adapter_reconnects_when_noop_fails():
+    stale, fresh = _fake_conn(), _fake_conn()
+    stale.noop.side_effect = imaplib.IMAP4.abort("socket closed")
+    adapter = IMAPAdapter(persistent=True)
+    with patch.object(adapter, "connect", side_effect=[stale, fresh]) as connect:
+        adapter.fetch_messages()
+        adapter.fetch_messages()
+
+    assert connect.call_count == 2
+    assert adapter._conn is fresh
+
+
+def test_persistent_adapter_drops_connection_on_abort():
+    conn = _fake_conn()
+    conn.search.side_effect = imaplib.IMAP4.abort("connection reset")
+    adapter = IMAPAdapter(persistent=True)
+    with patch.object(adapter, "connect", return_value=conn):
+        with pytest.raises(ConnectionError):
+            adapter.fetch_messages()
+
+    assert adapter._conn is None
+
+
+def _raw_email(n):
+    return f"From: a{n}@example.com\r\nTo: support@example.com\r\nSubject: Msg {n}\r\n\r\nBody {n}\r\n".encode()
+
+
+def test_abort_mid_poll_returns_messages_already_marked_seen():
+    conn = _fake_conn()
+    conn.search.return_value = ("OK", [b"1 2 3"])
+    conn.fetch.side_effect = [
+        ("OK", [(b"1 (RFC822)", _raw_email(1))]),
+        imaplib.IMAP4.abort("connection reset"),
+    ]
+    adapter = IMAPAdapter(persistent=True)
+    with patch.object(adapter, "connect", return_value=conn):
+        messages = adapter.fetch_messages()
+
+    assert [m.subject for m in messages] == ["Msg 1"]
+    conn.store.assert_called_once_with(b"1", "+FLAGS", "\\Seen")
+    assert adapter._conn is None
+
+
+def test_abort_while_flagging_second_message_keeps_both():
+    conn = _fake_conn()
+    conn.search.return_value = ("OK", [b"1 2"])
+    conn.fetch.side_effect = [
+        ("OK", [(b"1 (RFC822)", _raw_email(1))]),
+        ("OK", [(b"2 (RFC822)", _raw_email(2))]),
+    ]
+    conn.store.side_effect = [("OK", []), OSError("broken pipe")]
+    adapter = IMAPAdapter()
+    with patch.object(adapter, "connect", return_value=conn):
+        messages = adapter.fetch_messages()
+
+    assert [m.subject for m in messages] == ["Msg 1", "Msg 2"]
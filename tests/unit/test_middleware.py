@@ -0,0 +1,87 @@
+"""
+Unit tests for the agent/admin guard middleware.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import path
+from django.utils import translation
+
+from escalated import middleware
+from escalated.middleware import EnsureAdminMiddleware, EnsureAgentMiddleware
+from tests.factories import DepartmentFactory, UserFactory
+
+# The guards redirect anonymous users to the "login" URL.
+urlpatterns = [path("login/", lambda request: HttpResponse(), name="login")]
+
+GUARDS = [EnsureAgentMiddleware, EnsureAdminMiddleware]
+
+
+@pytest.fixture
+def fresh_denied_bodies():
+    middleware._denied_body.cache_clear()
+    yield
+    middleware._denied_body.cache_clear()
+
+
+def _check(middleware_class, path, user):
+    request = RequestFactory().get(path)
+    request.user = user
+    return middleware_class(lambda r: HttpResponse()).process_view(request, None, [], {})
+
+
+@pytest.mark.django_db
+@pytest.mark.urls(__name__)
+class TestGuardMiddleware:
+    @pytest.mark.parametrize("middleware_class", GUARDS)
+    @pytest.mark.parametrize("public_path", ["/static/app.js", "/healthz", "/favicon.ico"])
+    def test_public_paths_skip_the_check(self, middleware_class, public_path):
+        assert _check(middleware_class, public_path, AnonymousUser()) is None
+
+    @pytest.mark.parametrize("middleware_class", GUARDS)
+    def test_public_entries_without_trailing_slash_match_exactly(self, middleware_class):
+        response = _check(middleware_class, "/healthzanything", AnonymousUser())
+        assert response.status_code == 302
+
+    @pytest.mark.parametrize("middleware_class", GUARDS)
+    def test_guarded_path_redirects_anonymous_users_to_login(self, middleware_class):
+        response = _check(middleware_class, "/support/agent/", AnonymousUser())
+        assert response.status_code == 302
+        assert response.url == "/login/"
+
+    @pytest.mark.parametrize("middleware_class", GUARDS)
+    def test_guarded_path_forbids_customers(self, middleware_class):
+        response = _check(middleware_class, "/support/agent/", UserFactory())
+        assert response.status_code == 403
+
+    def test_agent_passes_agent_guard_but_not_admin_guard(self):
+        agent = UserFactory()
+        DepartmentFactory().agents.add(agent)
+
+        assert _check(EnsureAgentMiddleware, "/support/agent/", agent) is None
+        assert _check(EnsureAdminMiddleware, "/support/admin/", agent).status_code == 403
+
+    def test_admin_passes_both_guards(self):
+        admin = UserFactory(is_staff=True, is_superuser=True)
+
+        assert _check(EnsureAgentMiddleware, "/support/agent/", admin) is None
+        assert _check(EnsureAdminMiddleware, "/support/admin/", admin) is None
+
+    def test_denied_body_is_cached_per_language(self, monkeypatch, fresh_denied_bodies):
+        # The shipped catalogs don't translate these strings yet; tag the
+        # text with the active language so a cross-locale hit would show.
+        monkeypatch.setattr(middleware, "_", lambda message: f"[{translation.get_language()}] {message}")
+        customer = UserFactory()
+
+        bodies = []
+        for language in ["fr", "de", "fr"]:
+            with translation.override(language):
+                response = _check(EnsureAgentMiddleware, "/support/agent/", customer)
+            assert response.status_code == 403
+            bodies.append(response.content.decode())
+
+        assert bodies[0] == bodies[2] == f"[fr] {middleware._AGENT_DENIED}"
+        assert bodies[1] == f"[de] {middleware._AGENT_DENIED}"
+        assert middleware._denied_body.cache_info().hits == 1
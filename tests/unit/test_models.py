@@ -1,9 +1,10 @@
 from datetime import timedelta
 
 import pytest
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
-from escalated.models import Reply, Ticket
+from escalated.models import EscalatedSetting, Reply, Ticket
 from tests.factories import (
     DepartmentFactory,
     ReplyFactory,
@@ -58,6 +59,53 @@ class TestTicketModel:
         ticket.status = Ticket.Status.OPEN
         assert ticket.is_resolved is False
 
+    def test_resolved_ticket_requires_resolved_at(self):
+        ticket = TicketFactory()
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Ticket.objects.filter(pk=ticket.pk).update(status=Ticket.Status.RESOLVED)
+
+    def test_save_stamps_resolved_at_when_only_status_changes(self):
+        ticket = TicketFactory()
+        ticket.status = Ticket.Status.RESOLVED
+        ticket.save(update_fields=["status"])
+
+        ticket.refresh_from_db()
+        assert ticket.resolved_at is not None
+
+    def test_set_status_writes_only_status_columns(self):
+        ticket = TicketFactory(subject="Original")
+        Ticket.objects.filter(pk=ticket.pk).update(subject="Edited elsewhere")
+
+        ticket.set_status(Ticket.Status.RESOLVED)
+        ticket.refresh_from_db()
+        assert ticket.status == Ticket.Status.RESOLVED
+        assert ticket.resolved_at is not None
+        assert ticket.subject == "Edited elsewhere"
+
+        ticket.set_status(Ticket.Status.REOPENED)
+        ticket.refresh_from_db()
+        assert ticket.resolved_at is None
+
+    def test_follow_helpers_use_prefetched_followers(self, django_assert_num_queries):
+        follower = UserFactory()
+        ticket = TicketFactory()
+        ticket.follow(follower.pk)
+        ticket = Ticket.objects.prefetch_related("ticket_followers").get(pk=ticket.pk)
+
+        with django_assert_num_queries(0):
+            assert ticket.is_followed_by(follower.pk) is True
+            assert ticket.is_followed_by(follower.pk + 1) is False
+            assert ticket.followers_count == 1
+
+    def test_follow_is_idempotent(self, django_assert_num_queries):
+        follower = UserFactory()
+        ticket = TicketFactory()
+        ticket.follow(follower.pk)
+
+        with django_assert_num_queries(1):
+            ticket.follow(follower.pk)
+        assert ticket.followers_count == 1
+
     def test_ticket_is_closed_property(self):
         ticket = TicketFactory(status=Ticket.Status.CLOSED)
         assert ticket.is_closed is True
@@ -91,6 +139,15 @@ class TestTicketModel:
         assert unassigned in result
         assert assigned not in result
 
+    def test_ticket_queryset_filter_by(self):
+        agent = UserFactory(username="filter_agent")
+        match = TicketFactory(assigned_to=agent, priority=Ticket.Priority.HIGH)
+        TicketFactory(assigned_to=agent, priority=Ticket.Priority.LOW)
+        TicketFactory(priority=Ticket.Priority.HIGH)
+
+        result = Ticket.objects.filter_by(status=Ticket.Status.OPEN, priority="high", assigned_to=agent.pk)
+        assert list(result) == [match]
+
     def test_ticket_queryset_assigned_to(self):
         agent = UserFactory(username="assigned_agent")
         ticket = TicketFactory(assigned_to=agent)
@@ -237,3 +294,103 @@ class TestDepartmentModel:
 
         assert dept.agents.count() == 2
         assert agent1 in dept.agents.all()
+
+
+@pytest.mark.django_db
+class TestRequesterUserMirror:
+    def test_user_requester_is_mirrored_on_save(self):
+        user = UserFactory()
+        ticket = TicketFactory(requester=user)
+        assert ticket.requester_user_id == user.pk
+        assert ticket.get_requester() == user
+
+    def test_guest_ticket_has_no_requester_user(self):
+        ticket = TicketFactory(guest_name="Guest", guest_email="g@example.com", guest_token="tok-mirror")
+        assert ticket.requester_user_id is None
+
+    def test_list_query_resolves_requester_without_extra_queries(self, django_assert_num_queries):
+        users = [UserFactory() for _ in range(3)]
+        for user in users:
+            TicketFactory(requester=user)
+
+        with django_assert_num_queries(1):
+            names = [t.requester_email for t in Ticket.objects.select_related("requester_user")]
+        assert sorted(names) == sorted(u.email for u in users)
+
+    def test_bulk_log_mirrors_causer_user(self):
+        from django.contrib.contenttypes.models import ContentType
+
+        from escalated.models import TicketActivity
+
+        user = UserFactory()
+        ticket = TicketFactory()
+        ct = ContentType.objects.get_for_model(user)
+        TicketActivity.bulk_log(
+            [
+                TicketActivity(ticket=ticket, type="tag_added", causer_content_type=ct, causer_object_id=user.pk),
+                TicketActivity(ticket=ticket, type="tag_removed"),
+            ]
+        )
+        mirrored = dict(ticket.activities.values_list("type", "causer_user_id"))
+        assert mirrored == {"tag_added": user.pk, "tag_removed": None}
+
+    def test_ticket_still_saves_after_requester_is_deleted(self):
+        user = UserFactory()
+        ticket = TicketFactory(requester=user)
+        user.delete()
+
+        ticket = Ticket.objects.get(pk=ticket.pk)
+        assert ticket.requester_user_id is None
+        ticket.subject = "Edited after the requester left"
+        ticket.save()
+
+        ticket.refresh_from_db()
+        assert ticket.requester_user_id is None
+        assert ticket.subject == "Edited after the requester left"
+
+    def test_deleted_user_is_not_mirrored_into_new_rows(self):
+        from django.contrib.contenttypes.models import ContentType
+
+        from escalated.models import TicketActivity
+
+        user = UserFactory()
+        ct = ContentType.objects.get_for_model(user)
+        user_pk = user.pk
+        user.delete()
+
+        ticket = TicketFactory(requester_content_type=ct, requester_object_id=str(user_pk))
+        assert ticket.requester_user_id is None
+        TicketActivity.bulk_log(
+            [TicketActivity(ticket=ticket, type="tag_added", causer_content_type=ct, causer_object_id=user_pk)]
+        )
+        assert ticket.activities.get().causer_user_id is None
+
+
+@pytest.mark.django_db
+class TestEscalatedSettingCache:
+    def test_get_is_cached_including_misses(self, django_assert_num_queries):
+        EscalatedSetting.set("ticket_reference_prefix", "SUP")
+        with django_assert_num_queries(1):
+            assert EscalatedSetting.get("ticket_reference_prefix") == "SUP"
+            assert EscalatedSetting.get("ticket_reference_prefix") == "SUP"
+        with django_assert_num_queries(1):
+            assert EscalatedSetting.get("missing_key", "x") == "x"
+            assert EscalatedSetting.get("missing_key", "x") == "x"
+
+    def test_set_and_delete_evict_cached_value(self):
+        EscalatedSetting.set("ticket_reference_prefix", "SUP")
+        assert EscalatedSetting.get("ticket_reference_prefix") == "SUP"
+
+        EscalatedSetting.set("ticket_reference_prefix", "HLP")
+        assert EscalatedSetting.get("ticket_reference_prefix") == "HLP"
+
+        EscalatedSetting.objects.filter(key="ticket_reference_prefix").get().delete()
+        assert EscalatedSetting.get("ticket_reference_prefix", "ESC") == "ESC"
+
+    @pytest.mark.parametrize(
+        "stored, expected",
+        [("1", True), ("True", True), ("YES", True), (" on ", True), ("0", False), ("false", False), ("", False)],
+    )
+    def test_get_bool(self, stored, expected):
+        EscalatedSetting.set("some_flag", stored)
+        assert EscalatedSetting.get_bool("some_flag") is expected
@@ -0,0 +1,52 @@
+import pytest
+
+from escalated.permissions import can_reply_ticket, can_update_ticket, can_view_ticket, is_agent
+from tests.factories import DepartmentFactory, TicketFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestPermissions:
+    def test_is_agent_is_remembered_on_the_user(self, django_assert_num_queries):
+        user = UserFactory()
+        DepartmentFactory().agents.add(user)
+
+        with django_assert_num_queries(1):
+            assert is_agent(user) is True
+            assert is_agent(user) is True
+
+    def test_requester_check_needs_no_queries(self, django_assert_num_queries):
+        user = UserFactory()
+        ticket = TicketFactory(requester=user)
+        ticket = type(ticket).objects.get(pk=ticket.pk)
+
+        with django_assert_num_queries(0):
+            assert can_view_ticket(user, ticket) is True
+            assert can_reply_ticket(user, ticket) is True
+
+    def test_department_agent_check_is_one_query(self, django_assert_num_queries):
+        user = UserFactory()
+        department = DepartmentFactory()
+        department.agents.add(user)
+        ticket = TicketFactory(department=department)
+        ticket = type(ticket).objects.get(pk=ticket.pk)
+
+        with django_assert_num_queries(1):
+            assert can_view_ticket(user, ticket) is True
+
+    def test_agent_of_inactive_ticket_department_can_view(self):
+        user = UserFactory()
+        department = DepartmentFactory(is_active=False)
+        department.agents.add(user)
+        ticket = TicketFactory(department=department)
+
+        assert can_view_ticket(user, ticket) is True
+        assert can_view_ticket(UserFactory(), ticket) is False
+
+    def test_assignee_check_does_not_load_the_assignee(self, django_assert_num_queries):
+        user = UserFactory()
+        ticket = TicketFactory(assigned_to=user)
+        ticket = type(ticket).objects.get(pk=ticket.pk)
+
+        with django_assert_num_queries(0):
+            assert can_view_ticket(user, ticket) is True
+            assert can_update_ticket(user, ticket) is True
@@ -39,3 +39,43 @@ class TestPluginService:
         service = PluginService()
         result = service.get_all_plugins()
         assert isinstance(result, list)
+
+    def test_manifest_is_reparsed_only_when_changed(self, tmp_path, settings):
+        import json
+        import os
+
+        from escalated.plugin_service import PluginService
+
+        settings.ESCALATED = {**getattr(settings, "ESCALATED", {}), "PLUGINS_PATH": str(tmp_path)}
+        manifest_path = tmp_path / "demo" / "plugin.json"
+        manifest_path.parent.mkdir()
+        manifest_path.write_text(json.dumps({"name": "Demo"}))
+
+        service = PluginService()
+        first = service._get_manifest("demo")
+        assert first == {"name": "Demo"}
+        assert PluginService()._get_manifest("demo") is first
+
+        manifest_path.write_text(json.dumps({"name": "Demo 2"}))
+        stat = os.stat(manifest_path)
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert service._get_manifest("demo") == {"name": "Demo 2"}
+
+    def test_local_plugins_load_db_state_in_one_query(self, tmp_path, settings, django_assert_num_queries):
+        import json
+
+        from escalated.plugin_service import PluginService
+
+        settings.ESCALATED = {**getattr(settings, "ESCALATED", {}), "PLUGINS_PATH": str(tmp_path)}
+        for slug in ("alpha", "beta", "gamma"):
+            (tmp_path / slug).mkdir()
+            (tmp_path / slug / "plugin.json").write_text(json.dumps({"name": slug.title()}))
+        (tmp_path / "README.txt").write_text("not a plugin")
+        EscalatedPlugin.objects.create(slug="beta", is_active=True)
+
+        service = PluginService()
+        with django_assert_num_queries(1):
+            plugins = service._get_local_plugins()
+
+        assert [p["slug"] for p in plugins] == ["alpha", "beta", "gamma"]
+        assert [p["is_active"] for p in plugins] == [False, True, False]
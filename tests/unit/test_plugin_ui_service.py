@@ -0,0 +1,26 @@
+from escalated.plugin_ui_service import PluginUIService
+
+
+class TestPluginUIService:
+    def test_submenu_item_attaches_to_first_matching_parent(self):
+        ui = PluginUIService()
+        ui.add_menu_item({"label": "Reports"})
+        ui.add_menu_item({"label": "Reports", "position": 200})
+        ui.add_menu_item({"label": "Settings"})
+
+        ui.add_submenu_item("Reports", {"label": "Weekly"})
+        ui.add_submenu_item("Missing", {"label": "Ignored"})
+
+        reports, duplicate, settings = ui.get_menu_items()
+        assert [s["label"] for s in reports["submenu"]] == ["Weekly"]
+        assert duplicate["submenu"] == []
+        assert settings["submenu"] == []
+        assert PluginUIService._MENU_DEFAULTS["submenu"] == []
+
+    def test_clear_forgets_menu_labels(self):
+        ui = PluginUIService()
+        ui.add_menu_item({"label": "Reports"})
+        ui.clear()
+
+        ui.add_submenu_item("Reports", {"label": "Weekly"})
+        assert ui.get_menu_items() == []
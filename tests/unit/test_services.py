@@ -3,7 +3,7 @@ from datetime import timedelta
 import pytest
 from django.utils import timezone
 
-from escalated.models import EscalationRule, Ticket
+from escalated.models import EscalationRule, Ticket, TicketQuerySet
 from escalated.services.escalation_service import EscalationService
 from escalated.services.sla_service import SlaService
 from escalated.services.ticket_service import TicketService
@@ -148,6 +148,24 @@ class TestSlaService:
         breached_count, warned_count = SlaService.check_all_tickets()
         assert breached_count >= 1
 
+    def test_check_all_tickets_visits_every_ticket_across_chunks(self, monkeypatch):
+        policy = SlaPolicyFactory()
+        tickets = [
+            TicketFactory(
+                sla_policy=policy,
+                first_response_due_at=timezone.now() - timedelta(hours=1),
+                first_response_at=None,
+            )
+            for _ in range(5)
+        ]
+        in_pk_chunks = TicketQuerySet.in_pk_chunks
+        monkeypatch.setattr(TicketQuerySet, "in_pk_chunks", lambda qs: in_pk_chunks(qs, size=2))
+
+        breached_count, _ = SlaService.check_all_tickets()
+
+        assert breached_count == 5
+        assert Ticket.objects.filter(pk__in=[t.pk for t in tickets], sla_first_response_breached=True).count() == 5
+
 
 @pytest.mark.django_db
 class TestEscalationService:
@@ -252,6 +270,20 @@ class TestEscalationService:
         actions_taken = EscalationService.evaluate_all()
         assert actions_taken >= 1
 
+    def test_evaluate_all_escalates_each_ticket_once_across_chunks(self, monkeypatch):
+        EscalationRuleFactory(
+            trigger_type=EscalationRule.TriggerType.SLA_BREACH,
+            conditions={},
+            actions={"escalate": True},
+        )
+        for _ in range(5):
+            TicketFactory(sla_first_response_breached=True, status=Ticket.Status.OPEN)
+        in_pk_chunks = TicketQuerySet.in_pk_chunks
+        monkeypatch.setattr(TicketQuerySet, "in_pk_chunks", lambda qs: in_pk_chunks(qs, size=2))
+
+        assert EscalationService.evaluate_all() == 5
+        assert Ticket.objects.filter(status=Ticket.Status.ESCALATED).count() == 5
+
 
 @pytest.mark.django_db
 class TestTicketService:
@@ -287,6 +319,33 @@ class TestTicketService:
 
         assert ticket.priority == Ticket.Priority.URGENT
 
+    def test_create_ticket_query_count(self, django_assert_num_queries):
+        service = TicketService()
+        service.create(UserFactory(), {"subject": "Warm", "description": "Caches settings"})
+        user = UserFactory()
+
+        with django_assert_num_queries(8):
+            ticket = service.create(user, {"subject": "Counted", "description": "Body"})
+
+        assert ticket.requester_user_id == user.pk
+        assert ticket.activities.get(type="created", causer_user__isnull=False).causer_user_id == user.pk
+
+    def test_change_status_query_count(self, django_assert_num_queries):
+        user = UserFactory()
+        ticket = TicketFactory(requester=user, status=Ticket.Status.OPEN)
+
+        with django_assert_num_queries(4):
+            TicketService().change_status(ticket, user, Ticket.Status.IN_PROGRESS)
+
+    def test_agent_reply_query_count(self, django_assert_num_queries):
+        agent = UserFactory()
+        ticket = TicketFactory(status=Ticket.Status.OPEN)
+
+        with django_assert_num_queries(7):
+            TicketService().reply(ticket, agent, {"body": "On it"})
+
+        assert ticket.status == Ticket.Status.WAITING_ON_CUSTOMER
+
     def test_update_ticket(self):
         user = UserFactory(username="update_user")
         ticket = TicketFactory(requester=user, subject="Original")
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from escalated import tasks
+from escalated.mail.inbound_message import InboundMessage
+from escalated.models import InboundEmail
+from tests.factories import SlaPolicyFactory, TicketFactory
+
+
+class _StubAdapter:
+    def __init__(self, messages=(), error=None):
+        self.messages = list(messages)
+        self.error = error
+
+    def fetch_messages(self):
+        if self.error:
+            raise self.error
+        return self.messages
+
+
+@pytest.fixture
+def imap_enabled(settings, monkeypatch):
+    settings.ESCALATED = {**settings.ESCALATED, "INBOUND_EMAIL_ENABLED": True, "IMAP_HOST": "imap.example.com"}
+
+    def use(adapter):
+        monkeypatch.setattr(tasks, "_imap_adapter", adapter)
+
+    return use
+
+
+@pytest.mark.django_db
+class TestTasks:
+    def test_check_sla_reports_breaches(self):
+        TicketFactory(
+            sla_policy=SlaPolicyFactory(),
+            first_response_due_at=timezone.now() - timedelta(hours=1),
+            first_response_at=None,
+        )
+
+        assert tasks.check_sla() == {"breached": 1, "warned": 0}
+
+    def test_poll_imap_is_a_no_op_when_inbound_email_is_disabled(self):
+        assert tasks.poll_imap() == {"processed": 0, "failed": 0}
+
+    def test_poll_imap_processes_messages_through_the_service(self, imap_enabled):
+        imap_enabled(
+            _StubAdapter(
+                [
+                    InboundMessage(
+                        from_email="customer@example.com",
+                        from_name=None,
+                        to_email="support@example.com",
+                        subject="Printer on fire",
+                        body_text="Help",
+                        body_html=None,
+                        message_id="<task-1@example.com>",
+                    )
+                ]
+            )
+        )
+
+        assert tasks.poll_imap() == {"processed": 1, "failed": 0}
+        assert InboundEmail.objects.get().status == InboundEmail.Status.PROCESSED
+
+    def test_poll_imap_survives_connection_errors(self, imap_enabled):
+        imap_enabled(_StubAdapter(error=ConnectionError("refused")))
+
+        assert tasks.poll_imap() == {"processed": 0, "failed": 0}